@@ -7,8 +7,11 @@ A multi-threaded simulation featuring:
 - Location tracking and social behavior
 """
 
+import sys
 import time
 import random
+import logging
+from collections import namedtuple
 from park3.clock import Clock
 from park3.metrics import Metrics
 from park3.bathroom import Toilet
@@ -58,24 +61,29 @@ def create_initial_groups(num_groups=30):
     
     return groups_created
 
-def create_rides(clock, metrics):
-    rides_config = [
-        ('RollerCoaster', 24, 5, 0.015, 90, 3, 140),     # 90min repair (1.5 hours)
-        ('DropTower', 16, 4, 0.002, 75, 2, 145),          # 75min repair
-        ('FerrisWheel', 32, 8, 0.001, 60, 4, 0),          # 60min repair (1 hour)
-        ('HauntedHouse', 20, 6, 0.0015, 80, 3, 140),      # 80min repair
-        ('SpinningTeacups', 16, 4, 0.018, 70, 2, 100),   # 70min repair
-        ('BumperCars', 20, 5, 0.002, 85, 3, 110),         # 85min repair
-        ('SplashMountain', 28, 7, 0.1, 100, 4, 120),   # 100min repair
-        ('SpaceSimulator', 12, 6, 0.03, 120, 2, 120),    # 120min repair (2 hours)
-        ('CarouselHorses', 24, 5, 0.01, 65, 3, 0),       # 65min repair
-    ]
-    
+class RideSpec(namedtuple('RideSpec', 'name capacity duration break_prob repair_time board_window min_height_cm')):
+    """Static configuration for one ride"""
+    __slots__ = ()
+
+# Built once at import; repair times are in sim minutes
+_RIDES_CONFIG = (
+    RideSpec('RollerCoaster', 24, 5, 0.015, 90, 3, 140),     # 90min repair (1.5 hours)
+    RideSpec('DropTower', 16, 4, 0.002, 75, 2, 145),          # 75min repair
+    RideSpec('FerrisWheel', 32, 8, 0.001, 60, 4, 0),          # 60min repair (1 hour)
+    RideSpec('HauntedHouse', 20, 6, 0.0015, 80, 3, 140),      # 80min repair
+    RideSpec('SpinningTeacups', 16, 4, 0.018, 70, 2, 100),   # 70min repair
+    RideSpec('BumperCars', 20, 5, 0.002, 85, 3, 110),         # 85min repair
+    RideSpec('SplashMountain', 28, 7, 0.1, 100, 4, 120),   # 100min repair
+    RideSpec('SpaceSimulator', 12, 6, 0.03, 120, 2, 120),    # 120min repair (2 hours)
+    RideSpec('CarouselHorses', 24, 5, 0.01, 65, 3, 0),       # 65min repair
+)
+
+def create_rides(clock, metrics, specs=_RIDES_CONFIG):
     rides = []
-    for name, capacity, duration, break_prob, repair_time, board_window, min_height in rides_config:
-        queue = Queue()
-        ride = Ride(name, queue, clock, capacity, duration, 
-                   break_prob, repair_time, board_window, metrics, min_height_cm=min_height)
+    for spec in specs:
+        ride = Ride(spec.name, Queue(), clock, spec.capacity, spec.duration,
+                   spec.break_prob, spec.repair_time, spec.board_window, metrics,
+                   min_height_cm=spec.min_height_cm)
         rides.append(ride)
     return rides
 
@@ -155,6 +163,9 @@ def create_staff(clock, park, rides):
     return staff_manager
 
 if __name__ == "__main__":
+    # Per-visitor group logging is DEBUG; keep it off unless asked for
+    logging.basicConfig(level=logging.WARNING)
+    
     print("\n" + "="*60)
     print("AMUSEMENT PARK SIMULATION")
     print("With Social Groups and Staff Management")
@@ -175,6 +186,13 @@ if __name__ == "__main__":
         'AdrenalineAddict': 0.2
     }
     
+    # Visitor and staff steps are pure Python, so only a free-threaded
+    # build (3.13t and later) runs them on several cores at once
+    gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if gil_enabled is None or gil_enabled():
+        print("\nNote: the GIL is enabled; a free-threaded Python build lets "
+              "visitor and staff steps run in parallel.")
+    
     print(f"\nConfiguration:")
     print(f"  Total Visitors: {TOTAL_VISITORS}")
     print(f"  Park Hours: {PARK_HOURS} minutes")
@@ -1,5 +1,6 @@
 import threading
 import random
+from park3.simple_social_visitor import VISITOR_CTORS
 
 class ArrivalGenerator(threading.Thread):
     """
@@ -25,6 +26,12 @@ class ArrivalGenerator(threading.Thread):
             }
         self.visitor_mix = visitor_mix
         
+        # Resolve each type's constructor once instead of per arrival
+        unknown = set(visitor_mix) - set(VISITOR_CTORS)
+        if unknown:
+            raise ValueError(f"Unknown visitor type: {sorted(unknown)[0]}")
+        self._ctors = {kind: VISITOR_CTORS[kind] for kind in visitor_mix}
+        
         # Group information (optional)
         self.initial_groups = initial_groups if initial_groups is not None else []
         
@@ -123,24 +130,19 @@ class ArrivalGenerator(threading.Thread):
         
     def run(self):
         """Release visitors according to the schedule"""
-        current_minute = 0
+        park = self.park
+        clock = self.clock
+        ctors = self._ctors
+        # Social systems are attached to the park before the simulation starts
+        location_tracker = park.location_tracker
+        group_manager = park.group_manager
+        group_coordinator = park.group_coordinator
         
-        while not self.clock.should_stop() and current_minute < self.park_hours:
-            now = self.clock.now()
-            
-            # Safety check: stop if we've gone past park hours
-            if now >= self.park_hours:
+        # Sleep straight to each minute that has arrivals instead of polling
+        for minute in sorted(self.arrival_schedule):
+            if minute >= self.park_hours or not clock.wait_until(minute):
                 break
-            
-            # Check if we've reached the next minute
-            if now >= current_minute:
-                # Release any visitors scheduled for this minute
-                if current_minute in self.arrival_schedule:
-                    for vid, visitor_type, is_group_member in self.arrival_schedule[current_minute]:
-                        visitor = self.park.create_visitor(visitor_type, vid)
-                        visitor.start()
-                        
-                current_minute += 1
-                
-            # Small sleep to avoid busy waiting
-            self.clock.sleep_minutes(0.5)
\ No newline at end of file
+            for vid, visitor_type, is_group_member in self.arrival_schedule[minute]:
+                visitor = ctors[visitor_type](vid, park, clock, self.metrics, location_tracker,
+                                              group_manager, group_coordinator)
+                park.start_visitor(visitor)
@@ -3,13 +3,13 @@ import time
 import random
 from queue import Queue
 
-class Toilet(threading.Thread):
+class Toilet:
     """
     A bathroom/toilet facility that serves visitors one at a time.
     Very similar in spirit to FoodTruck: sits in a loop, handles its queue.
+    Its loop is a cooperative task on the park's scheduler.
     """
     def __init__(self, name, queue: Queue, clock, metrics=None):
-        super().__init__(daemon=True)
         self.name = name
         self.queue = queue
         self.clock = clock
@@ -18,14 +18,17 @@ class Toilet(threading.Thread):
         self._lock = threading.Lock()
 
     def run(self):
-        """Main loop: keep serving visitors while the park is running."""
+        """
+        Main loop: keep serving visitors while the park is running.
+        A generator that yields sim minutes to sleep between steps.
+        """
         while self._open and not self.clock.should_stop():
             if self.queue.is_empty():
                 # No one waiting – small idle pause
-                self.clock.sleep_minutes(random.randint(1, 3))
+                yield random.randint(1, 3)
                 continue
 
-            self._serve_next_visitor()
+            yield from self._serve_next_visitor()
 
     def _serve_next_visitor(self):
         """Take the next visitor from the queue and let them use the bathroom."""
@@ -33,12 +36,13 @@ class Toilet(threading.Thread):
             visitor = self.queue.dequeue_one()
             if visitor is None:
                 return
+            visitor.notify_served()
 
         vid = getattr(visitor, "vid", "unknown")
         print(f"[{self.name}] is occupied by Visitor {vid}")
 
         # Simulate time spent in bathroom (in sim minutes)
-        self.clock.sleep_minutes(random.randint(2, 6))
+        yield random.randint(2, 6)
 
         print(f"Visitor {vid} has finished using {self.name}")
         if self.metrics is not None and vid != "unknown":
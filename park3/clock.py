@@ -1,5 +1,7 @@
 import threading
 import time
+import heapq
+import itertools
 
 class Clock:
     """
@@ -18,12 +20,20 @@ class Clock:
         self._start_time = None
         self._stop_flag = False
         self._lock = threading.Lock()
+        # Signalled on start and stop so waiters don't have to poll
+        self._changed = threading.Condition(self._lock)
+        
+        # Periodic callbacks: min-heap of (due_minute, seq, interval, callback)
+        self._timers = []
+        self._timer_seq = itertools.count()
+        self._timer_thread = None
         
     def start(self):
         """Start the simulation clock"""
         with self._lock:
             self._start_time = time.time()
             self._stop_flag = False
+            self._changed.notify_all()
             
     def now(self):
         """Get current simulated minute"""
@@ -42,9 +52,86 @@ class Clock:
                     
             return current
     
+    def max_minutes(self):
+        """Get the configured simulation length in minutes (or None)"""
+        return self._max_minutes
+    
+    def real_seconds(self, minutes):
+        """Convert simulated minutes to real seconds"""
+        return minutes * self._speed_factor
+    
     def sleep_minutes(self, minutes):
         """Sleep for simulated minutes"""
         time.sleep(minutes * self._speed_factor)
+    
+    def wait_until(self, target_minute) -> bool:
+        """
+        Block until the simulated clock reaches target_minute.
+        Returns False if the simulation stops (or hits max_minutes) first.
+        """
+        with self._changed:
+            while True:
+                remaining = self._seconds_until(target_minute)
+                if remaining is None:
+                    return False
+                if remaining <= 0:
+                    return True
+                # Before start() there is no deadline; wait to be notified
+                self._changed.wait(None if remaining == float('inf') else remaining)
+    
+    def _seconds_until(self, target_minute):
+        """
+        Real seconds until target_minute (inf before start), or None once
+        the simulation has stopped. Caller holds the lock.
+        """
+        if self._stop_flag:
+            return None
+        if self._start_time is None:
+            return float('inf')
+        elapsed_real = time.time() - self._start_time
+        if self._max_minutes is not None and target_minute > self._max_minutes:
+            # Auto-stop once we pass the limit, as now() does
+            if elapsed_real >= self._max_minutes * self._speed_factor:
+                self._stop_flag = True
+                self._changed.notify_all()
+                return None
+            target_minute = self._max_minutes
+        return target_minute * self._speed_factor - elapsed_real
+    
+    def every(self, minutes, callback):
+        """
+        Call callback() every `minutes` simulated minutes until the clock stops.
+        All periodic callbacks share one timer thread, started on first use.
+        """
+        with self._changed:
+            start = 0
+            if self._start_time is not None:
+                start = int((time.time() - self._start_time) / self._speed_factor)
+            heapq.heappush(self._timers, (start + minutes, next(self._timer_seq), minutes, callback))
+            if self._timer_thread is None:
+                self._timer_thread = threading.Thread(target=self._run_timers, daemon=True)
+                self._timer_thread.start()
+            else:
+                # The new timer may be due before the one being waited for
+                self._changed.notify_all()
+    
+    def _run_timers(self):
+        """Fire periodic callbacks as they fall due"""
+        while True:
+            with self._changed:
+                while True:
+                    due, seq, interval, callback = self._timers[0]
+                    remaining = self._seconds_until(due)
+                    if remaining is None:
+                        return
+                    if remaining <= 0:
+                        break
+                    self._changed.wait(None if remaining == float('inf') else remaining)
+                heapq.heapreplace(self._timers, (due + interval, seq, interval, callback))
+            try:
+                callback()
+            except Exception as e:
+                print(f"[CLOCK] Periodic callback failed: {e!r}")
         
     def should_stop(self):
         """Check if simulation should stop"""
@@ -54,4 +141,5 @@ class Clock:
     def stop(self):
         """Signal all threads to stop"""
         with self._lock:
-            self._stop_flag = True
\ No newline at end of file
+            self._stop_flag = True
+            self._changed.notify_all()
\ No newline at end of file
@@ -1,13 +1,12 @@
 import threading
 import random
 
-class FoodTruck(threading.Thread):
+class FoodTruck:
     """
     A food service facility that serves visitors one at a time.
-    Runs as its own thread, processing its queue continuously.
+    Its service loop is a cooperative task on the park's scheduler.
     """
     def __init__(self, name, queue, clock, metrics=None):
-        super().__init__(daemon=True)
         self.name = name
         self.queue = queue
         self.clock = clock
@@ -29,17 +28,21 @@ class FoodTruck(threading.Thread):
         }
         
     def run(self):
-        """Main service loop - serves visitors from queue"""
+        """
+        Main service loop - serves visitors from queue.
+        A generator that yields sim minutes to sleep between steps.
+        """
         while not self.clock.should_stop() and self._open:
             visitor = self.queue.dequeue_one()
             
             if visitor is None:
                 # No customers, wait a bit
-                self.clock.sleep_minutes(1)
+                yield 1
                 continue
+            visitor.notify_served()
                 
             # Serve the visitor
-            self._serve_visitor(visitor)
+            yield from self._serve_visitor(visitor)
             
     def _serve_visitor(self, visitor):
         """Process one visitor's order with affordability logic"""
@@ -63,7 +66,11 @@ class FoodTruck(threading.Thread):
 
         # Simulate service time (1–3 minutes)
         service_time = random.randint(1, 3)
-        self.clock.sleep_minutes(service_time)
+        yield service_time
+
+        # Visitor left the park while waiting and was reused for a new arrival
+        if visitor.vid != vid:
+            return
 
         # Deduct money
         visitor.money -= price
@@ -1,13 +1,12 @@
 import threading
 import random
 
-class MerchStand(threading.Thread):
+class MerchStand:
     """
     A merchandise stand that sells items to visitors one at a time.
-    Runs as its own thread, processing its queue continuously.
+    Its service loop is a cooperative task on the park's scheduler.
     """
     def __init__(self, name, queue, clock, metrics=None):
-        super().__init__(daemon=True)
         self.name = name
         self.queue = queue          # your Queue instance
         self.clock = clock          # shared Clock
@@ -32,21 +31,24 @@ class MerchStand(threading.Thread):
         Main loop: similar to deliver_service(festival) from your old code.
         - If queue is empty: wait 1–4 sim minutes.
         - Otherwise: serve one customer via buy_merch().
+        A generator that yields sim minutes to sleep between steps.
         """
         while not self.clock.should_stop() and self._open:
             if self.queue.is_empty():
                 # No customers right now, wait a bit
-                self.clock.sleep_minutes(random.randint(1, 4))
+                yield random.randint(1, 4)
                 continue
 
             # Someone is waiting → sell merch
-            self.buy_merch()
+            yield self.buy_merch()
 
     def buy_merch(self):
+        """Sell to the next customer; returns the sim minutes it took"""
         with self._lock:
             person = self.queue.dequeue_one()
             if person is None:
-                return
+                return 0
+            person.notify_served()
 
             product = random.choice(list(self.products.keys()))
             price = self.products[product]
@@ -55,7 +57,7 @@ class MerchStand(threading.Thread):
             if getattr(person, "money", 0) < price:
                 # Not enough money → visitor leaves without purchase
                 print(f"[{self.name}] Visitor {person.vid} cannot afford a {product} (${price})")
-                return
+                return 0
 
             # Otherwise, complete purchase
             person.money -= price
@@ -75,7 +77,7 @@ class MerchStand(threading.Thread):
                 )
 
         # simulate processing time
-        self.clock.sleep_minutes(random.randint(1, 2))
+        return random.randint(1, 2)
 
 
     def get_profit(self):
@@ -1,8 +1,11 @@
 import threading
-from collections import defaultdict
+from collections import defaultdict, deque
 import sqlite3
 from typing import Optional
 
+# Buffered group activities a thread collects before writing them out
+GROUP_ACTIVITY_BATCH = 64
+
 class Metrics:
     """
     Collects statistics about the simulation.
@@ -26,8 +29,18 @@ class Metrics:
         # Social group tracking
         self.group_activities = []  # Track group activities together
         
+        # Per-thread group activity buffers (see record_group_activity_async)
+        self._local = threading.local()
+        self._activity_buffers = []  # Every thread's buffer, so all can be flushed
+        self._buffers_lock = threading.Lock()
+        self._flusher = None
+        self._flusher_stop = threading.Event()
+        
         # Staff performance tracking
         self.staff_actions = []  # Track staff actions (cleaning, incidents, etc.)
+        # Staff actions not yet written out; deque.append is atomic, so
+        # recording one takes no lock (see flush_staff_actions)
+        self._staff_action_buf = deque()
         
         # Ride incidents tracking
         self.ride_breakdowns = []  # Track when rides break down
@@ -175,6 +188,9 @@ class Metrics:
 
     def close(self):
         """Close the database connection if open."""
+        self._flusher_stop.set()
+        self.flush_group_activities()
+        self.flush_staff_actions()
         if self.conn is not None:
             with self.lock:
                 self.conn.close()
@@ -311,24 +327,104 @@ class Metrics:
                     (group_id, activity_type, location, minute, member_count)
                 )
     
+    def record_group_activity_async(self, group_id, activity_type, location, minute, member_count):
+        """
+        Buffer a group activity on the calling thread.
+        Buffers are written out in one batch when full, every second by a
+        background flusher, and before any summary is read.
+        """
+        buf = getattr(self._local, 'activities', None)
+        if buf is None:
+            buf = self._local.activities = []
+            with self._buffers_lock:
+                self._activity_buffers.append(buf)
+            self._start_flusher()
+        buf.append((group_id, activity_type, location, minute, member_count))
+        if len(buf) >= GROUP_ACTIVITY_BATCH:
+            self.flush_group_activities()
+    
+    def _start_flusher(self):
+        """Start the background flusher if it isn't running yet"""
+        with self._buffers_lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+                self._flusher.start()
+    
+    def _flush_periodically(self):
+        """Background loop that flushes buffered activities and staff actions every second"""
+        while not self._flusher_stop.wait(1.0):
+            self.flush_group_activities()
+            self.flush_staff_actions()
+    
+    def flush_group_activities(self):
+        """Write out every thread's buffered group activities"""
+        with self._buffers_lock:
+            buffers = list(self._activity_buffers)
+        
+        with self.lock:
+            rows = []
+            for buf in buffers:
+                # Owners keep appending, so only take what is there now
+                n = len(buf)
+                rows.extend(buf[:n])
+                del buf[:n]
+            if not rows:
+                return
+            
+            for group_id, activity_type, location, minute, member_count in rows:
+                self.group_activities.append({
+                    'group_id': group_id,
+                    'activity_type': activity_type,
+                    'location': location,
+                    'minute': minute,
+                    'member_count': member_count
+                })
+            if self.conn is not None:
+                self.conn.executemany(
+                    "INSERT INTO group_activities (group_id, activity_type, location, minute, member_count) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+                self.conn.commit()
+    
     def record_staff_action(self, staff_id, staff_name, staff_type, action_type, location, minute, efficiency=1.0):
-        """Record a staff member performing an action"""
+        """
+        Record a staff member performing an action.
+        The action is buffered and written out with others by the
+        background flusher, and before any summary is read.
+        """
+        self._staff_action_buf.append(
+            (staff_id, staff_name, staff_type, action_type, location, minute, efficiency)
+        )
+        if self._flusher is None:
+            self._start_flusher()
+    
+    def flush_staff_actions(self):
+        """Write out buffered staff actions in one batch"""
+        buf = self._staff_action_buf
         with self.lock:
-            self.staff_actions.append({
-                'staff_id': staff_id,
-                'staff_name': staff_name,
-                'staff_type': staff_type,
-                'action_type': action_type,
-                'location': location,
-                'minute': minute,
-                'efficiency': efficiency
-            })
+            # Recorders keep appending, so only take what is there now
+            rows = [buf.popleft() for _ in range(len(buf))]
+            if not rows:
+                return
+            
+            for staff_id, staff_name, staff_type, action_type, location, minute, efficiency in rows:
+                self.staff_actions.append({
+                    'staff_id': staff_id,
+                    'staff_name': staff_name,
+                    'staff_type': staff_type,
+                    'action_type': action_type,
+                    'location': location,
+                    'minute': minute,
+                    'efficiency': efficiency
+                })
             if self.conn is not None:
-                self._insert(
+                self.conn.executemany(
                     "INSERT INTO staff_actions (staff_id, staff_name, staff_type, action_type, location, minute, efficiency) "
                     "VALUES (?, ?, ?, ?, ?, ?, ?)",
-                    (staff_id, staff_name, staff_type, action_type, location, minute, efficiency)
+                    rows
                 )
+                self.conn.commit()
     
     def record_ride_breakdown(self, ride_name, minute, repair_duration):
         """Record a ride breaking down"""
@@ -401,11 +497,20 @@ class Metrics:
 
     def get_summary(self):
         """Get summary statistics from in-memory aggregations."""
+        self.flush_group_activities()
+        self.flush_staff_actions()
         with self.lock:
+            ride_counts = dict(self.ride_counts)
+            # (ride name, rides) of the most ridden ride, or None before any rides
+            most_popular = None
+            if ride_counts:
+                name = max(ride_counts, key=ride_counts.get)
+                most_popular = (name, ride_counts[name])
             return {
                         'total_visitors': len(self.visitor_arrivals),
                         'total_exits': len(self.visitor_exits),
-                        'ride_counts': dict(self.ride_counts),
+                        'ride_counts': ride_counts,
+                        'most_popular': most_popular,
                         'food_purchases': dict(self.food_purchases),
                         'merch_purchases': dict(self.merch_purchases),
                         'total_food_revenue': self.total_food_revenue,
@@ -1,6 +1,9 @@
 import threading
 import random
-from park3.simple_social_visitor import SocialChildCreator, SocialTouristCreator, SocialAdrenalineAddictCreator
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from park3.simple_social_visitor import VISITOR_CTORS
+from park3.visitor_scheduler import VisitorScheduler
 
 class Park:
     """
@@ -26,6 +29,22 @@ class Park:
         self._visitors = []
         self._merch_stands = []
         self._bathrooms = []
+        
+        # Immutable snapshots of the facility lists, rebuilt when one is added
+        self._food_tuple = ()
+        self._merch_tuple = ()
+        self._bathrooms_tuple = ()
+        
+        # Ride lookups kept in step with add_ride and ride state changes
+        self._rides_by_name = {}  # name -> Ride, copy-on-write
+        self._operational_names = frozenset()  # replaced wholesale on change
+        self._rides_tuple = ()  # indexed by ride.bit
+        self._operational_mask = 0  # bit ride.bit set while that ride accepts riders
+        self._operational_lock = threading.Lock()
+        
+        # Memoized ride selections, dropped whenever a ride is added
+        self._height_masks = {}  # height_cm -> ride bitmask
+        self._eligible_cache = {}  # ride bitmask -> tuple of rides
 
         # Thread-safe locks
         self._rides_lock = threading.Lock()
@@ -34,52 +53,124 @@ class Park:
         self._merch_lock = threading.Lock()
         self._bathrooms_lock = threading.Lock()
         
-        # Always use social visitors (they work for solo visitors too)
-        self._creators = {
-            'Child': SocialChildCreator(),
-            'Tourist': SocialTouristCreator(),
-            'AdrenalineAddict': SocialAdrenalineAddictCreator()
-        }
+        # Shared worker pool for all service loops (created on first use)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        
+        # Cooperative scheduler for visitors and service counters (created on first use)
+        self._visitor_scheduler = None
+        
+        # Pending ride maintenance, filled by start_maintenance_scheduler
+        self._maint_schedule = []
+
         
     def add_ride(self, ride):
         """Add a ride to the park"""
         with self._rides_lock:
+            ride.bit = len(self._rides)
             self._rides.append(ride)
+            self._rides_tuple = tuple(self._rides)
+            rides_by_name = dict(self._rides_by_name)
+            rides_by_name[ride.name] = ride
+            self._rides_by_name = rides_by_name
+            self._height_masks = {}
+            self._eligible_cache = {}
+        ride.on_availability_change = self._ride_availability_changed
+        self._ride_availability_changed(ride)
+    
+    def _ride_availability_changed(self, ride):
+        """Keep the operational ride name set in step with a ride's state"""
+        with self._operational_lock:
+            if ride.is_operational():
+                self._operational_names = self._operational_names | {ride.name}
+                self._operational_mask |= 1 << ride.bit
+            else:
+                self._operational_names = self._operational_names - {ride.name}
+                self._operational_mask &= ~(1 << ride.bit)
+    
+    def get_ride(self, name):
+        """Look up a ride by name (None if there is no such ride)"""
+        return self._rides_by_name.get(name)
+    
+    def get_operational_ride_names(self):
+        """Get the names of rides currently accepting riders"""
+        return self._operational_names
+    
+    def get_operational_mask(self):
+        """Get a bitmask of rides currently accepting riders (bit = ride.bit)"""
+        return self._operational_mask
+    
+    def height_mask(self, height_cm):
+        """Get a bitmask of the rides someone of this height may ride"""
+        masks = self._height_masks
+        mask = masks.get(height_cm)
+        if mask is None:
+            mask = 0
+            for ride in self._rides_tuple:
+                if height_cm >= ride.min_height_cm:
+                    mask |= 1 << ride.bit
+            masks[height_cm] = mask
+        return mask
+    
+    def rides_in_mask(self, mask):
+        """
+        Get the rides whose bits are set in mask, lowest bit first.
+        The mask already says which rides are open and tall enough, so
+        the tuple is built once per distinct mask and then reused.
+        """
+        cache = self._eligible_cache
+        rides = cache.get(mask)
+        if rides is None:
+            all_rides = self._rides_tuple
+            found = []
+            bits = mask
+            while bits:
+                low = bits & -bits
+                found.append(all_rides[low.bit_length() - 1])
+                bits ^= low
+            rides = cache[mask] = tuple(found)
+        return rides
             
     def add_food_facility(self, facility):
         """Add a food facility to the park"""
         with self._food_lock:
             self._food_facilities.append(facility)
+            self._food_tuple = tuple(self._food_facilities)
             
     def get_rides(self):
-        """Get list of all rides"""
-        with self._rides_lock:
-            return self._rides.copy()
+        """Get the shared read-only tuple of all rides, indexed by ride.bit"""
+        return self._rides_tuple
             
     def get_food_facilities(self):
-        """Get list of all food facilities"""
-        with self._food_lock:
-            return self._food_facilities.copy()
+        """Get the shared read-only tuple of all food facilities"""
+        return self._food_tuple
             
     def create_visitor(self, visitor_type, vid):
-        """Create a visitor using the factory pattern"""
-        if visitor_type not in self._creators:
+        """Create a visitor of the given type (always a social visitor)"""
+        ctor = VISITOR_CTORS.get(visitor_type)
+        if ctor is None:
             raise ValueError(f"Unknown visitor type: {visitor_type}")
-            
-        creator = self._creators[visitor_type]
-        
         # Pass all systems (they can be None, visitors will handle it)
-        visitor = creator.register_visitor(
-            vid, self, self.clock, self.metrics,
-            location_tracker=self.location_tracker,
-            group_manager=self.group_manager,
-            group_coordinator=self.group_coordinator
-        )
-        
+        return ctor(vid, self, self.clock, self.metrics, self.location_tracker,
+                    self.group_manager, self.group_coordinator)
+    
+    def _scheduler(self):
+        """Get the shared cooperative scheduler, starting it on first use"""
+        with self._executor_lock:
+            if self._visitor_scheduler is None:
+                self._visitor_scheduler = VisitorScheduler(self.clock)
+                self._visitor_scheduler.start()
+            return self._visitor_scheduler
+    
+    def start_task(self, task):
+        """Run a generator that yields sim minutes to sleep on the shared scheduler"""
+        self._scheduler().add_task(task)
+    
+    def start_visitor(self, visitor):
+        """Track a newly arrived visitor and hand it to the shared scheduler"""
         with self._visitors_lock:
             self._visitors.append(visitor)
-            
-        return visitor
+        self._scheduler().add(visitor)
         
     def join_ride_queue(self, visitor, ride):
         """Add a visitor to a ride's queue"""
@@ -98,33 +189,53 @@ class Park:
         """Add a visitor to a food facility's queue"""
         facility.queue.add_person(visitor)
         
+    def _submit(self, fn, *args):
+        """Run a long-lived service loop on the shared worker pool"""
+        with self._executor_lock:
+            if self._executor is None:
+                # Every ride loop holds a worker for the whole day, plus
+                # the maintenance loop
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(self._rides) + 1,
+                    thread_name_prefix="park"
+                )
+            future = self._executor.submit(fn, *args)
+        future.add_done_callback(self._report_loop_failure)
+        return future
+    
+    @staticmethod
+    def _report_loop_failure(future):
+        """Surface exceptions that would otherwise stay inside the future"""
+        if not future.cancelled() and future.exception() is not None:
+            print(f"[PARK] Service loop stopped with error: {future.exception()!r}")
+        
     def start_all_rides(self):
-        """Start all ride threads"""
+        """Start all ride loops"""
         with self._rides_lock:
             for ride in self._rides:
-                ride.start()
+                self._submit(ride.run)
                 
     def start_all_food_facilities(self):
-        """Start all food facility threads"""
-        with self._food_lock:
-            for facility in self._food_facilities:
-                facility.start()
+        """Start all food facility loops on the shared scheduler"""
+        scheduler = self._scheduler()
+        for facility in self._food_tuple:
+            scheduler.add_task(facility.run())
 
     def start_all_bathrooms(self):
-        """Start all bathroom threads"""
-        with self._bathrooms_lock:
-            for bathroom in self._bathrooms:
-                bathroom.start()
+        """Start all bathroom loops on the shared scheduler"""
+        scheduler = self._scheduler()
+        for bathroom in self._bathrooms_tuple:
+            scheduler.add_task(bathroom.run())
 
     def add_bathroom(self, bathroom):
         """Register a new bathroom in the park"""
         with self._bathrooms_lock:
             self._bathrooms.append(bathroom)
+            self._bathrooms_tuple = tuple(self._bathrooms)
 
     def get_bathrooms(self):
-        """Return a copy of the bathroom list"""
-        with self._bathrooms_lock:
-            return list(self._bathrooms)
+        """Get the shared read-only tuple of all bathrooms"""
+        return self._bathrooms_tuple
 
     def join_bathroom_queue(self, visitor, bathroom):
         """Put a visitor into the queue of a specific bathroom"""
@@ -134,55 +245,69 @@ class Park:
         """Add a merchandise stand to the park"""
         with self._merch_lock:
             self._merch_stands.append(stand)
+            self._merch_tuple = tuple(self._merch_stands)
 
     def get_merch_stands(self):
-        """Get list of all merch stands"""
-        with self._merch_lock:
-            return self._merch_stands.copy()
+        """Get the shared read-only tuple of all merch stands"""
+        return self._merch_tuple
 
     def join_merch_queue(self, visitor, stand):
         """Add a visitor to a merch stand queue"""
         stand.queue.add_person(visitor)
 
     def start_all_merch_stands(self):
-        """Start all merch stand threads"""
-        with self._merch_lock:
-            for stand in self._merch_stands:
-                stand.start()
+        """Start all merch stand loops on the shared scheduler"""
+        scheduler = self._scheduler()
+        for stand in self._merch_tuple:
+            scheduler.add_task(stand.run())
 
     def start_cleanliness_degradation(self):
-        """Start background cleanliness degradation thread"""
+        """Degrade cleanliness every 10 minutes on the clock's timer thread"""
         if self.cleanliness_manager:
-            degradation_thread = threading.Thread(
-                target=self.cleanliness_manager.periodic_degradation,
-                args=(self.clock,),
-                daemon=True
-            )
-            degradation_thread.start()
+            manager = self.cleanliness_manager
+            self.clock.every(10, lambda: manager.degrade_once(self.clock))
     
-    def start_maintenance_scheduler(self):
-        """Start periodic maintenance scheduler for rides"""
-        def maintenance_worker():
-            """Schedule periodic maintenance for rides"""
-            while not self.clock.should_stop():
-                # Wait for some time before scheduling maintenance (2-4 hours)
-                self.clock.sleep_minutes(random.randint(120, 240))
-                
-                with self._rides_lock:
-                    # Pick a random ride for maintenance
-                    if self._rides:
-                        ride = random.choice(self._rides)
-                        # Only schedule if ride is operational
-                        if ride.is_operational():
-                            maintenance_duration = random.randint(15, 30)
-                            print(f"[SCHEDULER] Scheduling {maintenance_duration}min maintenance for {ride.name}")
-                            ride.schedule_maintenance(maintenance_duration)
-        
-        maintenance_thread = threading.Thread(
-            target=maintenance_worker,
-            daemon=True
-        )
-        maintenance_thread.start()
+    def start_maintenance_scheduler(self, seed=None):
+        """
+        Start periodic maintenance scheduler for rides.
+        The whole day's maintenance events are drawn up front so a given
+        seed always produces the same schedule.
+        """
+        rng = random.Random(seed)
+        day_end = self.clock.max_minutes() or 480
+        
+        self._maint_schedule = []  # min-heap of (minute, ride_index, duration)
+        with self._rides_lock:
+            num_rides = len(self._rides)
+        
+        if num_rides:
+            minute = self.clock.now()
+            while True:
+                # Next maintenance window in 2-4 hours
+                minute += rng.randint(120, 240)
+                if minute >= day_end:
+                    break
+                heapq.heappush(self._maint_schedule,
+                               (minute, rng.randrange(num_rides), rng.randint(15, 30)))
+        
+        self._submit(self._maintenance_worker)
+    
+    def _maintenance_worker(self):
+        """Run the pre-computed maintenance schedule"""
+        while self._maint_schedule and not self.clock.should_stop():
+            minute, ride_index, maintenance_duration = heapq.heappop(self._maint_schedule)
+            
+            # Sleep until the event is due
+            if not self.clock.wait_until(minute):
+                break
+            
+            with self._rides_lock:
+                ride = self._rides[ride_index]
+            
+            # Only schedule if ride is operational
+            if ride.is_operational():
+                print(f"[SCHEDULER] Scheduling {maintenance_duration}min maintenance for {ride.name}")
+                ride.schedule_maintenance(maintenance_duration)
                 
     def close_all(self):
         """Close all facilities and stop all threads"""
@@ -201,6 +326,13 @@ class Park:
         with self._merch_lock:
             for stand in self._merch_stands:
                 stand.close()
+        
+        # Loops exit on their own once closed; don't block waiting for them
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            if self._visitor_scheduler is not None:
+                self._visitor_scheduler.stop()
                 
     def get_total_visitors(self):
         """Get total number of visitors created"""
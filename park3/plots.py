@@ -30,20 +30,25 @@ def generate_plots(metrics, output_dir: str = "output"):
     print("GENERATING PLOTS")
     print(f"{'='*60}")
     
+    # The 14x7 bar charts share one Figure; each helper clears the axes first
+    bar_fig, bar_ax = plt.subplots(figsize=(14, 7), layout='constrained')
+    
     # Generate each plot
-    _plot_avg_wait_time_per_ride(data, output_dir)
+    _plot_avg_wait_time_per_ride(bar_ax, data, output_dir)
     _plot_population_over_time(data, output_dir)
-    _plot_revenue_per_facility(data, output_dir)
-    _plot_rides_per_attraction(data, output_dir)
+    _plot_revenue_per_facility(bar_ax, data, output_dir)
+    _plot_rides_per_attraction(bar_ax, data, output_dir)
     _plot_rides_per_visitor(data, output_dir)
     _plot_spending_vs_time(data, output_dir)
     _plot_time_per_visitor(data, output_dir)
     
+    plt.close(bar_fig)
+    
     print(f"\n✓ All plots saved to '{output_dir}/' directory")
     print(f"{'='*60}\n")
 
 
-def _plot_avg_wait_time_per_ride(data, output_dir):
+def _plot_avg_wait_time_per_ride(ax, data, output_dir):
     """Plot: Average wait time in minutes per each of the 9 rides"""
     avg_wait_times = data['avg_wait_times']
     
@@ -51,7 +56,7 @@ def _plot_avg_wait_time_per_ride(data, output_dir):
         print("  ⊘ Skipping avg_wait_time_per_ride.png (no data)")
         return
     
-    fig, ax = plt.subplots(figsize=(14, 7))
+    ax.clear()
     
     # Sort by ride name for consistency
     rides = sorted(avg_wait_times.keys())
@@ -61,11 +66,8 @@ def _plot_avg_wait_time_per_ride(data, output_dir):
     bars = ax.bar(x_pos, wait_times, color='coral', edgecolor='black', linewidth=1.5)
     
     # Add value labels on bars
-    for i, bar in enumerate(bars):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                f'{height:.1f} min',
-                ha='center', va='bottom', fontsize=10, fontweight='bold')
+    ax.bar_label(bars, labels=[f'{h:.1f} min' for h in wait_times],
+                 label_type='edge', padding=3, fontsize=10, fontweight='bold')
     
     ax.set_xlabel('Ride Name', fontsize=14, fontweight='bold')
     ax.set_ylabel('Average Wait Time (minutes)', fontsize=14, fontweight='bold')
@@ -73,11 +75,8 @@ def _plot_avg_wait_time_per_ride(data, output_dir):
     ax.set_xticks(x_pos)
     ax.set_xticklabels(rides, rotation=45, ha='right')
     ax.grid(axis='y', alpha=0.3, linestyle='--')
-    plt.tight_layout()
-    
     filepath = os.path.join(output_dir, 'avg_wait_time_per_ride.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight')
-    plt.close(fig)
+    ax.figure.savefig(filepath, dpi=300)
     print(f"  ✓ Saved avg_wait_time_per_ride.png")
 
 
@@ -90,17 +89,17 @@ def _plot_population_over_time(data, output_dir):
         print("  ⊘ Skipping population_over_time.png (no data)")
         return
     
-    fig, ax = plt.subplots(figsize=(16, 7))
+    fig, ax = plt.subplots(figsize=(16, 7), layout='constrained')
     
-    minutes = [p[0] for p in population_over_time]
-    population = [p[1] for p in population_over_time]
+    arr = np.asarray(population_over_time, dtype=np.float64)
+    minutes, population = arr[:, 0], arr[:, 1]
     
     ax.plot(minutes, population, color='#2E86AB', linewidth=2.5)
     ax.fill_between(minutes, population, alpha=0.3, color='#2E86AB')
     
     # Set x-axis to show 0-480 minutes
     ax.set_xlim(0, max(480, max_time) if max_time > 0 else 480)
-    ax.set_ylim(0, max(population) * 1.1 if population else 100)
+    ax.set_ylim(0, population.max() * 1.1 if population.size else 100)
     
     ax.set_xlabel('Simulation Time (minutes)', fontsize=14, fontweight='bold')
     ax.set_ylabel('Number of Visitors in Park', fontsize=14, fontweight='bold')
@@ -108,17 +107,15 @@ def _plot_population_over_time(data, output_dir):
     ax.grid(True, alpha=0.3, linestyle='--')
     
     # Add tick marks every 60 minutes
-    ax.set_xticks(range(0, int(ax.get_xlim()[1]) + 1, 60))
-    
-    plt.tight_layout()
+    ax.set_xticks(np.arange(0, int(ax.get_xlim()[1]) + 1, 60))
     
     filepath = os.path.join(output_dir, 'population_over_time.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight')
+    plt.savefig(filepath, dpi=300)
     plt.close(fig)
     print(f"  ✓ Saved population_over_time.png")
 
 
-def _plot_revenue_per_facility(data, output_dir):
+def _plot_revenue_per_facility(ax, data, output_dir):
     """Plot: Revenue in dollars per each merch stand and food truck"""
     facility_revenue = data['facility_revenue']
     
@@ -126,7 +123,7 @@ def _plot_revenue_per_facility(data, output_dir):
         print("  ⊘ Skipping revenue_per_facility.png (no data)")
         return
     
-    fig, ax = plt.subplots(figsize=(14, 7))
+    ax.clear()
     
     # Sort by revenue (highest to lowest)
     sorted_facilities = sorted(facility_revenue.items(), key=lambda x: x[1], reverse=True)
@@ -137,11 +134,8 @@ def _plot_revenue_per_facility(data, output_dir):
     bars = ax.bar(x_pos, revenues, color='#FFD700', edgecolor='black', linewidth=1.5)
     
     # Add value labels on bars
-    for i, bar in enumerate(bars):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + max(revenues) * 0.01,
-                f'${height:.2f}',
-                ha='center', va='bottom', fontsize=10, fontweight='bold')
+    ax.bar_label(bars, labels=[f'${r:.2f}' for r in revenues],
+                 label_type='edge', padding=3, fontsize=10, fontweight='bold')
     
     ax.set_xlabel('Facility Name', fontsize=14, fontweight='bold')
     ax.set_ylabel('Total Revenue ($)', fontsize=14, fontweight='bold')
@@ -149,15 +143,12 @@ def _plot_revenue_per_facility(data, output_dir):
     ax.set_xticks(x_pos)
     ax.set_xticklabels(facilities, rotation=45, ha='right')
     ax.grid(axis='y', alpha=0.3, linestyle='--')
-    plt.tight_layout()
-    
     filepath = os.path.join(output_dir, 'revenue_per_facility.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight')
-    plt.close(fig)
+    ax.figure.savefig(filepath, dpi=300)
     print(f"  ✓ Saved revenue_per_facility.png")
 
 
-def _plot_rides_per_attraction(data, output_dir):
+def _plot_rides_per_attraction(ax, data, output_dir):
     """Plot: Number of times each ride completed a round"""
     ride_counts = data['ride_counts']
     
@@ -165,7 +156,7 @@ def _plot_rides_per_attraction(data, output_dir):
         print("  ⊘ Skipping rides_per_attraction.png (no data)")
         return
     
-    fig, ax = plt.subplots(figsize=(14, 7))
+    ax.clear()
     
     # Sort by ride name for consistency
     rides = sorted(ride_counts.keys())
@@ -175,11 +166,8 @@ def _plot_rides_per_attraction(data, output_dir):
     bars = ax.bar(x_pos, counts, color='steelblue', edgecolor='black', linewidth=1.5)
     
     # Add value labels on bars
-    for i, bar in enumerate(bars):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + max(counts) * 0.01,
-                f'{int(height)}',
-                ha='center', va='bottom', fontsize=10, fontweight='bold')
+    ax.bar_label(bars, labels=[f'{int(c)}' for c in counts],
+                 label_type='edge', padding=3, fontsize=10, fontweight='bold')
     
     ax.set_xlabel('Ride Name', fontsize=14, fontweight='bold')
     ax.set_ylabel('Number of Completed Rounds', fontsize=14, fontweight='bold')
@@ -187,11 +175,8 @@ def _plot_rides_per_attraction(data, output_dir):
     ax.set_xticks(x_pos)
     ax.set_xticklabels(rides, rotation=45, ha='right')
     ax.grid(axis='y', alpha=0.3, linestyle='--')
-    plt.tight_layout()
-    
     filepath = os.path.join(output_dir, 'rides_per_attraction.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight')
-    plt.close(fig)
+    ax.figure.savefig(filepath, dpi=300)
     print(f"  ✓ Saved rides_per_attraction.png")
 
 
@@ -204,7 +189,7 @@ def _plot_rides_per_visitor(data, output_dir):
         print("  ⊘ Skipping rides_per_visitor.png (no data)")
         return
     
-    fig, ax = plt.subplots(figsize=(16, 7))
+    fig, ax = plt.subplots(figsize=(16, 7), layout='constrained')
     
     # Sort visitors by number of rides taken (least to most)
     sorted_data = sorted(zip(visitor_ids, visitor_rides_taken), key=lambda x: x[1])
@@ -233,10 +218,8 @@ def _plot_rides_per_visitor(data, output_dir):
                    label=f'Average: {avg_rides:.1f} rides')
         ax.legend(fontsize=12)
     
-    plt.tight_layout()
-    
     filepath = os.path.join(output_dir, 'rides_per_visitor.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight')
+    plt.savefig(filepath, dpi=300)
     plt.close(fig)
     print(f"  ✓ Saved rides_per_visitor.png")
 
@@ -249,10 +232,10 @@ def _plot_spending_vs_time(data, output_dir):
         print("  ⊘ Skipping spending_vs_time.png (no data)")
         return
     
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig, ax = plt.subplots(figsize=(12, 8), layout='constrained')
     
-    times = [p[0] for p in spend_vs_time]
-    spends = [p[1] for p in spend_vs_time]
+    arr = np.asarray(spend_vs_time, dtype=np.float64)
+    times, spends = arr[:, 0], arr[:, 1]
     
     scatter = ax.scatter(times, spends, alpha=0.6, s=60, 
                         c=spends, cmap='viridis', edgecolors='black', linewidth=0.5)
@@ -266,10 +249,8 @@ def _plot_spending_vs_time(data, output_dir):
     cbar = plt.colorbar(scatter, ax=ax)
     cbar.set_label('Money Spent ($)', fontsize=12, fontweight='bold')
     
-    plt.tight_layout()
-    
     filepath = os.path.join(output_dir, 'spending_vs_time.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight')
+    plt.savefig(filepath, dpi=300)
     plt.close(fig)
     print(f"  ✓ Saved spending_vs_time.png")
 
@@ -282,7 +263,7 @@ def _plot_time_per_visitor(data, output_dir):
         print("  ⊘ Skipping time_per_visitor.png (no data)")
         return
     
-    fig, ax = plt.subplots(figsize=(16, 7))
+    fig, ax = plt.subplots(figsize=(16, 7), layout='constrained')
     
     visitor_ids = [v[0] for v in visitor_time_data]
     times = [v[1] for v in visitor_time_data]
@@ -308,10 +289,8 @@ def _plot_time_per_visitor(data, output_dir):
                    label=f'Average: {avg_time:.1f} min')
         ax.legend(fontsize=12)
     
-    plt.tight_layout()
-    
     filepath = os.path.join(output_dir, 'time_per_visitor.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight')
+    plt.savefig(filepath, dpi=300)
     plt.close(fig)
     print(f"  ✓ Saved time_per_visitor.png")
 
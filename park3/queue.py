@@ -1,4 +1,5 @@
 import threading
+from collections import deque
 
 class Queue:
     """
@@ -6,9 +7,10 @@ class Queue:
     Used for rides, food trucks, and any service with waiting lines.
     """
     def __init__(self):
-        self.priority = []  # Fast pass holders
-        self.regular = []   # Regular visitors
+        self.priority = deque()  # Fast pass holders
+        self.regular = deque()   # Regular visitors
         self.lock = threading.Lock()
+        self._arrived = threading.Condition(self.lock)  # Signalled on every enqueue
         
     def enqueue(self, visitor, priority=False):
         """Add a visitor to the queue"""
@@ -17,6 +19,7 @@ class Queue:
                 self.priority.append(visitor)
             else:
                 self.regular.append(visitor)
+            self._arrived.notify_all()
                 
     def add_person(self, person):
         """Alias for enqueue (regular line)"""
@@ -26,9 +29,9 @@ class Queue:
         """Remove and return one visitor (priority first)"""
         with self.lock:
             if len(self.priority) > 0:
-                return self.priority.pop(0)
+                return self.priority.popleft()
             elif len(self.regular) > 0:
-                return self.regular.pop(0)
+                return self.regular.popleft()
             return None
             
     def pop_first_customer(self):
@@ -45,14 +48,24 @@ class Queue:
             
             # Take all priority visitors first
             while len(self.priority) > 0 and len(batch) < capacity:
-                batch.append(self.priority.pop(0))
+                batch.append(self.priority.popleft())
                 
             # Fill remaining capacity with regular visitors
             while len(self.regular) > 0 and len(batch) < capacity:
-                batch.append(self.regular.pop(0))
+                batch.append(self.regular.popleft())
                 
             return batch
     
+    def wait_for_size(self, count, timeout):
+        """
+        Block until at least count visitors are waiting or timeout
+        real seconds pass. Returns True if the queue reached count.
+        """
+        with self._arrived:
+            return self._arrived.wait_for(
+                lambda: len(self.priority) + len(self.regular) >= count, timeout
+            )
+    
     def size(self):
         """Return total number of visitors in queue"""
         with self.lock:
@@ -1,8 +1,9 @@
 import threading
 import random
+import math
 from .ride_states import RideState, OpenState, BoardingState, BrokenState, MaintenanceState
 
-class Ride(threading.Thread):
+class Ride:
     """
     An amusement park ride that uses the State design pattern.
     Different states handle different operational modes.
@@ -10,7 +11,6 @@ class Ride(threading.Thread):
     def __init__(self, name, queue, clock, capacity=20, 
                  run_duration=5, break_probability=0.02,  # Reduced from 0.05
                  repair_time=10, board_window=3, metrics=None, min_height_cm: int = 0):
-        super().__init__(daemon=True)
         self.name = name
         self.queue = queue
         self.clock = clock
@@ -21,21 +21,32 @@ class Ride(threading.Thread):
         self.board_window = board_window  # How long to wait for riders
         self.metrics = metrics
         self.min_height_cm = min_height_cm
+        self.bit = -1  # Position in the park's ride bitmasks, set by Park.add_ride
 
         
         self._open = True
         self._lock = threading.Lock()
         self._total_riders = 0
+        self._rng = random.Random(name)  # Private stream seeded from the name, so runs repeat
+        self._cycles_until_breakdown = self._sample_cycles()
         
         # Initialize all possible states
         self.open = OpenState()
         self.boarding = BoardingState()
-        self.broken_state_template = BrokenState  # Factory for broken states
-        self.maintenance_state_template = MaintenanceState  # Factory for maintenance
+        self._broken = BrokenState(0)  # Reused for every breakdown
+        self._maintenance = MaintenanceState(1)  # Reused for every maintenance window
         
         # Set the ride reference for each state
         self.open.ride = self
         self.boarding.ride = self
+        self._broken.ride = self
+        self._maintenance.ride = self
+        
+        # Cached copy of the current state's can_enqueue flag
+        self._can_enqueue: bool = True
+        
+        # Called with the ride whenever it opens to or closes to new riders
+        self.on_availability_change = None
         
         # Start in OPEN state
         self._current_state: RideState = None
@@ -45,43 +56,61 @@ class Ride(threading.Thread):
         """
         Transition to a new state.
         Calls on_exit() for old state and on_enter() for new state.
+        The single attribute store is the publication point, so readers
+        can pick up _current_state without taking the lock; the new state
+        is entered (and its timer set) before it is published.
         """
-        with self._lock:
-            if self._current_state is not None:
-                self._current_state.on_exit()
-                
-            self._current_state = new_state
-            self._current_state.on_enter()
+        old_state = self._current_state
+        if old_state is not None:
+            old_state.on_exit()
+            
+        new_state.entered_minute = self.clock.now()
+        new_state.on_enter()
+        self._current_state = new_state
+        was_open = self._can_enqueue
+        self._can_enqueue = new_state.can_enqueue
+        if was_open != self._can_enqueue and self.on_availability_change:
+            self.on_availability_change(self)
             
     def get_state_name(self) -> str:
         """Get the current state name"""
-        with self._lock:
-            return self._current_state.name()
+        return self._current_state.name
     
     def get_state_time_remaining(self) -> int:
         """Get time remaining for current state (if applicable)"""
         with self._lock:
-            if hasattr(self._current_state, '_remaining'):
-                return self._current_state._remaining
+            if hasattr(self._current_state, '_ends_at'):
+                # The ride loop may be asleep until the state ends
+                return max(0, self._current_state._ends_at - self.clock.now())
             return 0
         
     def run(self):
         """Main ride operation loop - delegates to current state"""
+        ticked_state, ticked_at = None, 0
         while not self.clock.should_stop() and self._open:
-            # Let the current state handle this tick
-            with self._lock:
-                current_state = self._current_state
-                
-            current_state.tick()
+            # Let the current state handle this tick, with the time since it
+            # was entered or last ticked (another thread may have switched
+            # states while the loop slept)
+            current_state = self._current_state
+            now = self.clock.now()
+            since = current_state.entered_minute
+            if current_state is ticked_state and ticked_at > since:
+                since = ticked_at
+            ticked_state, ticked_at = current_state, now
+            current_state.tick(now - since)
             
-            # Sleep for one simulated minute
-            self.clock.sleep_minutes(1)
+            # Sleep until the (possibly new) state next needs attention
+            self.clock.sleep_minutes(self._current_state.next_wake_minutes())
             
     def _run_cycle(self, batch):
         """
         Execute one ride cycle with a batch of visitors.
         Called by the BoardingState.
         """
+        # Riders may leave the park (and their visitor object be reused)
+        # while the ride runs, so note who boarded before it starts
+        riders = [(visitor, visitor.vid) for visitor in batch]
+        
         # Ride is running
         self.clock.sleep_minutes(self.run_duration)
         
@@ -89,35 +118,52 @@ class Ride(threading.Thread):
         with self._lock:
             self._total_riders += len(batch)
             
-        # Notify all visitors the ride is finished
-        for visitor in batch:
-            if self.metrics:
-                self.metrics.record_ride(visitor.vid, self.name, self.clock.now())
-            visitor.on_ride_finished(self.name, self.clock.now())
+        # Notify all visitors the ride is finished (they all finish together)
+        record = self.metrics.record_ride if self.metrics else None
+        name = self.name
+        now = self.clock.now()
+        for visitor, vid in riders:
+            if record:
+                record(vid, name, now)
+            if visitor.vid == vid:
+                visitor.on_ride_finished(name, now)
             
         # Small turnaround time
         self.clock.sleep_minutes(1)
         
-        # Chance of breakdown after cycle
-        if random.random() < self.break_probability:
+        # Breakdown once the pre-drawn number of cycles has run
+        self._cycles_until_breakdown -= 1
+        if self._cycles_until_breakdown == 0:
+            self._cycles_until_breakdown = self._sample_cycles()
             self._breakdown()
             
+    def _sample_cycles(self) -> int:
+        """
+        Draw how many cycles run until the next breakdown.
+        Geometric with success chance break_probability, so it matches
+        rolling the dice after every cycle.
+        """
+        p = self.break_probability
+        if p <= 0:
+            return -1  # Never reaches zero
+        if p >= 1:
+            return 1
+        u = 1.0 - self._rng.random()  # In (0, 1], keeps log() defined
+        return max(1, math.ceil(math.log(u) / math.log(1.0 - p)))
+            
     def _breakdown(self):
         """Trigger a breakdown - transition to broken state"""
-        broken = self.broken_state_template(self.repair_time)
-        broken.ride = self
-        self.transition_to(broken)
+        self._broken._remaining = max(0, self.repair_time)
+        self.transition_to(self._broken)
         
     def schedule_maintenance(self, minutes: int):
         """Schedule maintenance for this ride"""
-        maintenance = self.maintenance_state_template(minutes)
-        maintenance.ride = self
-        self.transition_to(maintenance)
+        self._maintenance._remaining = max(1, minutes)
+        self.transition_to(self._maintenance)
         
     def is_operational(self):
         """Check if ride is currently operational (can accept riders)"""
-        with self._lock:
-            return self._current_state.can_enqueue()
+        return self._can_enqueue
             
     def get_total_riders(self):
         """Get total number of riders served"""
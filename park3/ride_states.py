@@ -10,6 +10,7 @@ Implements different operational states for rides:
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from typing import ClassVar
 import random
 
 class RideState(ABC):
@@ -18,6 +19,15 @@ class RideState(ABC):
     # The Ride context will set this when we transition
     ride: "Ride" = None  # type: ignore
 
+    # Name of this state, set by each concrete state
+    name: ClassVar[str]
+
+    # Can visitors join the queue while in this state?
+    can_enqueue: ClassVar[bool]
+
+    # Clock minute this state was last entered, set by Ride.transition_to
+    entered_minute: int = 0
+
     # Optional hooks for state transitions
     def on_enter(self):
         """Called when entering this state"""
@@ -28,34 +38,28 @@ class RideState(ABC):
         pass
 
     @abstractmethod
-    def name(self) -> str:
-        """Return the name of this state"""
-        ...
-
-    @abstractmethod
-    def can_enqueue(self) -> bool:
-        """Can visitors join the queue while in this state?"""
-        ...
-
-    @abstractmethod
-    def tick(self):
+    def tick(self, elapsed: int = 1):
         """
-        Called by the Ride thread once per simulated minute.
+        Called by the Ride loop each time it wakes up, with the number of
+        simulated minutes since the previous tick (or since this state was
+        entered, if it has not been ticked since).
         This is where the state performs its work and may transition.
         """
         ...
 
+    def next_wake_minutes(self) -> int:
+        """How many simulated minutes the Ride loop can sleep before the next tick"""
+        return 1
+
 
 class OpenState(RideState):
     """Ride is open and waiting for visitors"""
     
-    def name(self) -> str:
-        return "OPEN"
+    name = "OPEN"
     
-    def can_enqueue(self) -> bool:
-        return True
+    can_enqueue = True
 
-    def tick(self):
+    def tick(self, elapsed: int = 1):
         # If there are people waiting, start boarding
         if self.ride.queue.size() > 0:
             self.ride.transition_to(self.ride.boarding)
@@ -64,25 +68,33 @@ class OpenState(RideState):
 class BoardingState(RideState):
     """Ride is boarding passengers"""
     
-    def name(self) -> str:
-        return "BOARDING"
+    name = "BOARDING"
     
-    def can_enqueue(self) -> bool:
-        return True  # Visitors can still join queue during boarding
+    can_enqueue = True  # Visitors can still join queue during boarding
 
     def on_enter(self):
         """Initialize boarding window timer"""
         self._minutes_in_window = 0
 
-    def tick(self):
+    def tick(self, elapsed: int = 1):
         """
         Give the queue a short window to fill seats.
         After boarding window or when batch is ready, run the ride.
         """
-        self._minutes_in_window += 1
+        self._minutes_in_window += elapsed
+        
+        # Sleep until the seats are full or the rest of the window runs out
+        remaining = self.ride.board_window - self._minutes_in_window
+        if remaining > 0:
+            self.ride.queue.wait_for_size(
+                self.ride.capacity, self.ride.clock.real_seconds(remaining)
+            )
+            self._minutes_in_window = self.ride.board_window
         
         # Try to get a batch of riders
         batch = self.ride.queue.dequeue_batch(self.ride.capacity)
+        for visitor in batch:
+            visitor.notify_served()
 
         if batch:
             # We have riders - run the ride cycle
@@ -113,17 +125,17 @@ class BrokenState(RideState):
     
     def __init__(self, repair_minutes: int = 0):
         self._remaining = max(0, repair_minutes)
+        self._ends_at = 0  # Clock minute the repair is done
 
-    def name(self) -> str:
-        return "BROKEN"
+    name = "BROKEN"
     
-    def can_enqueue(self) -> bool:
-        return False  # Can't join queue while broken
+    can_enqueue = False  # Can't join queue while broken
 
     def on_enter(self):
         """Set repair time and notify"""
         if self._remaining == 0:
             self._remaining = 15  # Default repair time
+        self._ends_at = self.entered_minute + self._remaining
         
         print(f"[ALERT] {self.ride.name} has BROKEN DOWN! Repair time: {self._remaining} minutes")
         
@@ -133,12 +145,13 @@ class BrokenState(RideState):
                 self.ride.name, self.ride.clock.now(), self._remaining
             )
 
-    def tick(self):
-        """Count down repair time"""
-        if self._remaining > 0:
-            self._remaining -= 1
-            
-        if self._remaining <= 0:
+    def next_wake_minutes(self) -> int:
+        """Nothing happens until the repair is done"""
+        return max(1, self._ends_at - self.ride.clock.now())
+
+    def tick(self, elapsed: int = 1):
+        """Reopen once the repair time has passed"""
+        if self.ride.clock.now() >= self._ends_at:
             print(f"[FIXED] {self.ride.name} is operational again!")
             self.ride.transition_to(self.ride.open)
 
@@ -148,15 +161,15 @@ class MaintenanceState(RideState):
     
     def __init__(self, minutes: int):
         self._remaining = max(1, minutes)
+        self._ends_at = 0  # Clock minute maintenance is over
 
-    def name(self) -> str:
-        return "MAINTENANCE"
+    name = "MAINTENANCE"
     
-    def can_enqueue(self) -> bool:
-        return False  # Can't join queue during maintenance
+    can_enqueue = False  # Can't join queue during maintenance
 
     def on_enter(self):
         """Notify of maintenance start"""
+        self._ends_at = self.entered_minute + self._remaining
         print(f"[MAINTENANCE] {self.ride.name} closed for {self._remaining} minutes of maintenance")
         
         # Track maintenance in metrics
@@ -165,10 +178,12 @@ class MaintenanceState(RideState):
                 self.ride.name, self.ride.clock.now(), self._remaining
             )
 
-    def tick(self):
-        """Count down maintenance time"""
-        self._remaining -= 1
-        
-        if self._remaining <= 0:
+    def next_wake_minutes(self) -> int:
+        """Nothing happens until maintenance is over"""
+        return max(1, self._ends_at - self.ride.clock.now())
+
+    def tick(self, elapsed: int = 1):
+        """Reopen once the maintenance window has passed"""
+        if self.ride.clock.now() >= self._ends_at:
             print(f"[REOPENED] {self.ride.name} maintenance complete!")
             self.ride.transition_to(self.ride.open)
\ No newline at end of file
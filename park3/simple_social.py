@@ -6,7 +6,8 @@ Speicifies the group behaviour coordinator, group manager, and location tracker.
 """
 
 import threading
-from typing import Set, Optional, List
+import random
+from typing import FrozenSet, Optional, List
 from enum import Enum
 from collections import defaultdict
 
@@ -23,40 +24,94 @@ class Location(Enum):
     WANDERING = "wandering"
 
 class LocationTracker:
-    """Tracks where each visitor is located"""
+    """
+    Tracks where each visitor is located.
+    Every visitor owns a [location_type, location_name] slot that only it
+    writes, so moving around takes no lock. The visitor_id -> slot dict is
+    copy-on-write and only changes when visitors arrive or leave.
+    Aggregate views are built from the slots when they are asked for.
+    """
     def __init__(self):
         self._lock = threading.Lock()
-        self._visitor_locations = {}  # visitor_id -> (location_type, location_name)
+        self._slots = {}  # visitor_id -> [location_type, location_name]
+        
+    def register(self, visitor_id: int) -> list:
+        """Get (creating if needed) the location slot a visitor writes to"""
+        slot = self._slots.get(visitor_id)
+        if slot is not None:
+            return slot
+        with self._lock:
+            slot = self._slots.get(visitor_id)
+            if slot is None:
+                slot = [None, None]
+                slots = dict(self._slots)
+                slots[visitor_id] = slot
+                self._slots = slots
+            return slot
         
     def update_location(self, visitor_id: int, location_type: Location, location_name: str):
         """Update a visitor's location"""
-        with self._lock:
-            self._visitor_locations[visitor_id] = (location_type, location_name)
+        slot = self._slots.get(visitor_id) or self.register(visitor_id)
+        slot[1] = location_name
+        slot[0] = location_type
     
     def get_visitor_location(self, visitor_id: int) -> Optional[tuple]:
-        """Get a visitor's current location"""
-        with self._lock:
-            return self._visitor_locations.get(visitor_id)
+        """Get a visitor's current location as (type, name)"""
+        slot = self._slots.get(visitor_id)
+        if slot is None or slot[0] is None:
+            return None
+        return (slot[0], slot[1])
+    
+    def get_visitor_location_type(self, visitor_id: int) -> Optional[Location]:
+        """Get only the type of a visitor's current location"""
+        slot = self._slots.get(visitor_id)
+        return slot[0] if slot is not None else None
+    
+    def get_visitor_location_name(self, visitor_id: int) -> Optional[str]:
+        """Get only the name of a visitor's current location"""
+        slot = self._slots.get(visitor_id)
+        return slot[1] if slot is not None and slot[0] is not None else None
+    
+    def get_slots(self) -> dict:
+        """Get the current visitor_id -> slot dict; treat it as read-only"""
+        return self._slots
+    
+    def get_locations(self, visitor_ids) -> dict:
+        """Get the locations of several visitors from a single snapshot"""
+        slots = self._slots
+        locations = {}
+        for vid in visitor_ids:
+            slot = slots.get(vid)
+            locations[vid] = (slot[0], slot[1]) if slot is not None and slot[0] is not None else None
+        return locations
     
     def remove_visitor(self, visitor_id: int):
         """Remove a visitor from tracking"""
         with self._lock:
-            self._visitor_locations.pop(visitor_id, None)
+            if visitor_id not in self._slots:
+                return
+            slots = dict(self._slots)
+            slot = slots.pop(visitor_id)
+            self._slots = slots
+        slot[0] = None  # Tombstone for anyone still holding the slot
+    
+    def snapshot(self) -> dict:
+        """Get every tracked visitor's current (type, name)"""
+        return {vid: (slot[0], slot[1])
+                for vid, slot in self._slots.items() if slot[0] is not None}
     
     def get_location_summary(self) -> dict:
         """Get count of visitors at each location"""
-        with self._lock:
-            summary = defaultdict(int)
-            for loc_type, loc_name in self._visitor_locations.values():
-                key = f"{loc_type.value}:{loc_name}"
-                summary[key] += 1
-            return dict(summary)
+        counts = defaultdict(int)
+        for loc_type, loc_name in self.snapshot().values():
+            counts[f"{loc_type.value}:{loc_name}"] += 1
+        return dict(counts)
 
 
 # Group Management 
 
-class GroupType(Enum):
-    """Types of social groups"""
+class GroupType(str, Enum):
+    """Types of social groups (members compare equal to their string values)"""
     FAMILY = "family"
     FRIENDS = "friends"
     COUPLE = "couple"
@@ -66,7 +121,7 @@ class SocialGroup:
     def __init__(self, group_id: int, group_type: GroupType, member_ids: List[int]):
         self.group_id = group_id
         self.group_type = group_type
-        self.members = set(member_ids)
+        self.members = frozenset(member_ids)  # replaced wholesale, never mutated
         self.leader_id = member_ids[0]  # First member is leader
         
     def is_leader(self, visitor_id: int) -> bool:
@@ -78,7 +133,10 @@ class SocialGroup:
         return len(self.members)
 
 class GroupManager:
-    """Manages all social groups in the park"""
+    """
+    Manages all social groups in the park.
+    The group lookup dicts are copy-on-write, so lookups don't take the lock.
+    """
     def __init__(self):
         self._lock = threading.Lock()
         self._groups = {}  # group_id -> SocialGroup
@@ -86,8 +144,13 @@ class GroupManager:
         self._next_group_id = 1
         
         # Track statistics (never cleared, for end-of-sim reporting)
-        self._created_groups = []  # List of all groups ever created
+        # Every group ever created, stored as parallel lists
+        self._group_ids = []
+        self._group_types = []  # group type value strings
+        self._group_sizes = []
         self._total_visitors_in_groups = 0
+        self._size_dist = defaultdict(int)  # group size -> count
+        self._type_dist = defaultdict(int)  # group type value -> count
         
     def create_group(self, group_type: GroupType, member_ids: List[int]) -> int:
         """Create a new social group"""
@@ -96,35 +159,41 @@ class GroupManager:
             self._next_group_id += 1
             
             group = SocialGroup(group_id, group_type, member_ids)
-            self._groups[group_id] = group
+            type_value = group_type.value
+            groups = dict(self._groups)
+            groups[group_id] = group
             
             # Track for statistics (permanent record)
-            self._created_groups.append({
-                'id': group_id,
-                'type': group_type,
-                'size': len(member_ids)
-            })
+            self._group_ids.append(group_id)
+            self._group_types.append(type_value)
+            self._group_sizes.append(len(member_ids))
             self._total_visitors_in_groups += len(member_ids)
+            self._size_dist[len(member_ids)] += 1
+            self._type_dist[type_value] += 1
             
+            visitor_to_group = dict(self._visitor_to_group)
             for vid in member_ids:
-                self._visitor_to_group[vid] = group_id
+                visitor_to_group[vid] = group_id
+            
+            # Publish both maps only once they are complete
+            self._groups = groups
+            self._visitor_to_group = visitor_to_group
                 
             return group_id
     
     def get_visitor_group(self, visitor_id: int) -> Optional[SocialGroup]:
         """Get the group a visitor belongs to"""
-        with self._lock:
-            group_id = self._visitor_to_group.get(visitor_id)
-            if group_id is None:
-                return None
-            return self._groups.get(group_id)
+        group_id = self._visitor_to_group.get(visitor_id)
+        if group_id is None:
+            return None
+        return self._groups.get(group_id)
     
-    def get_group_members(self, visitor_id: int) -> Set[int]:
+    def get_group_members(self, visitor_id: int) -> FrozenSet[int]:
         """Get all member IDs in this visitor's group"""
         group = self.get_visitor_group(visitor_id)
         if group is None:
-            return {visitor_id}
-        return group.members.copy()
+            return frozenset((visitor_id,))
+        return group.members
     
     def is_group_leader(self, visitor_id: int) -> bool:
         """Check if visitor is their group's leader"""
@@ -141,31 +210,31 @@ class GroupManager:
     def remove_visitor(self, visitor_id: int):
         """Remove visitor from tracking"""
         with self._lock:
-            if visitor_id in self._visitor_to_group:
-                group_id = self._visitor_to_group[visitor_id]
-                if group_id in self._groups:
-                    self._groups[group_id].members.discard(visitor_id)
-                    if len(self._groups[group_id].members) == 0:
-                        del self._groups[group_id]
-                del self._visitor_to_group[visitor_id]
+            group_id = self._visitor_to_group.get(visitor_id)
+            if group_id is None:
+                return
+            visitor_to_group = dict(self._visitor_to_group)
+            visitor_to_group.pop(visitor_id)
+            self._visitor_to_group = visitor_to_group
+            
+            group = self._groups.get(group_id)
+            if group is None:
+                return
+            group.members = group.members - {visitor_id}
+            if not group.members:
+                groups = dict(self._groups)
+                groups.pop(group_id)
+                self._groups = groups
     
     def get_statistics(self) -> dict:
         """Get statistics about groups"""
         with self._lock:
             # Use permanent records, not current active groups
-            group_sizes = defaultdict(int)
-            for group_info in self._created_groups:
-                group_sizes[group_info['size']] += 1
-            
-            group_types = defaultdict(int)
-            for group_info in self._created_groups:
-                group_types[group_info['type'].value] += 1
-            
             return {
-                'total_groups': len(self._created_groups),
+                'total_groups': len(self._group_ids),
                 'total_visitors_in_groups': self._total_visitors_in_groups,
-                'group_size_distribution': dict(group_sizes),
-                'group_types': dict(group_types),
+                'group_size_distribution': dict(self._size_dist),
+                'group_types': dict(self._type_dist),
                 'active_groups': len(self._groups)  # Currently active
             }
 
@@ -180,40 +249,37 @@ class GroupCoordinator:
     def __init__(self, group_manager, location_tracker):
         self.group_manager = group_manager
         self.location_tracker = location_tracker
+        self._rng = random.Random("GroupCoordinator")  # Private stream with a fixed seed, so runs repeat
         
     def should_wait_for_group(self, visitor_id: int) -> bool:
         """
         Check if visitor should wait for group members.
         Only leaders wait, and only if members are scattered.
         """
-        # Only check if in a group
-        if not self.group_manager.is_in_group(visitor_id):
-            return False
-        
-        # Only leaders coordinate waiting
-        if not self.group_manager.is_group_leader(visitor_id):
-            return False
-        
-        # Check how scattered the group is
+        # Only leaders of actual groups coordinate waiting
         group = self.group_manager.get_visitor_group(visitor_id)
-        if group is None:
+        if group is None or group.size() <= 1 or group.leader_id != visitor_id:
             return False
         
-        my_location = self.location_tracker.get_visitor_location(visitor_id)
-        if my_location is None:
+        # Check how scattered the group is (one snapshot for the whole group)
+        slots = self.location_tracker.get_slots()
+        my_slot = slots.get(visitor_id)
+        if my_slot is None or my_slot[0] is None:
             return False
+        my_type, my_name = my_slot
         
-        # Count how many are at different locations
+        # If more than half are elsewhere, wait (stop counting once we know)
+        threshold = group.size() // 2
         members_elsewhere = 0
         for member_id in group.members:
             if member_id == visitor_id:
                 continue
-            member_loc = self.location_tracker.get_visitor_location(member_id)
-            if member_loc != my_location:
+            slot = slots.get(member_id)
+            if slot is None or slot[0] != my_type or slot[1] != my_name:
                 members_elsewhere += 1
-        
-        # If more than half are elsewhere, wait
-        return members_elsewhere > group.size() / 2
+                if members_elsewhere > threshold:
+                    return True
+        return False
     
     def get_group_activity_preference(self, visitor_id: int, activity_choices: list) -> str:
         """
@@ -221,23 +287,19 @@ class GroupCoordinator:
         Non-leaders have high chance of following leader's location.
         """
         # Solo visitors or not in social system
-        if not self.group_manager.is_in_group(visitor_id):
+        group = self.group_manager.get_visitor_group(visitor_id)
+        if group is None or group.size() <= 1:
             return None
         
         # Leaders choose freely
-        if self.group_manager.is_group_leader(visitor_id):
+        if group.leader_id == visitor_id:
             return None
         
         # Non-leaders: 70% chance to follow leader
-        import random
-        if random.random() < 0.7:
-            group = self.group_manager.get_visitor_group(visitor_id)
-            if group:
-                leader_loc = self.location_tracker.get_visitor_location(group.leader_id)
-                if leader_loc:
-                    loc_type, loc_name = leader_loc
-                    # If leader is at a ride/food/merch, try to go there
-                    if loc_name in activity_choices:
-                        return loc_name
+        if self._rng.random() < 0.7:
+            loc_name = self.location_tracker.get_visitor_location_name(group.leader_id)
+            # If leader is at a ride/food/merch, try to go there
+            if loc_name is not None and loc_name in activity_choices:
+                return loc_name
         
         return None  # Choose randomly
\ No newline at end of file
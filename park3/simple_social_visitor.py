@@ -3,23 +3,121 @@ Simplified Social Visitor - Groups Only
 ========================================
 Visitors that belong to pre-formed groups and coordinate with each other.
 They interact with the park's rides, food facilities, merch stands, and bathrooms,
+Visitors are cooperative tasks: run() and the go_to_* helpers are generators that
+yield the number of simulated minutes to sleep (see visitor_scheduler.py).
 """
 
-import threading
 import random
-from abc import ABC, abstractmethod
+import logging
+from collections import deque
+from abc import ABC
+import numpy as np
 from park3.strategies import RideChoiceStrategy, PreferenceStrategy, RandomStrategy
 from park3.simple_social import Location
+from park3.visitor_scheduler import ServedEvent
 
-class SocialVisitor(threading.Thread, ABC):
+# Per-decision group chatter; enable DEBUG on "park.group" to see it
+_log = logging.getLogger("park.group")
+
+# Facility kind -> (cleanliness zone, dirt per visit, location, group activity name)
+_FACILITY_SPEC = {
+    'ride': ('rides', 0.5, Location.RIDE, 'ride'),
+    'bathroom': ('bathrooms', 1.0, Location.BATHROOM, None),
+    'food': ('food_court', 0.8, Location.FOOD, 'food'),
+    'merch': (None, 0.0, Location.MERCH, 'merch'),
+}
+
+# Actions returned by decide()
+ACTION_BATHROOM = 0
+ACTION_FOOD = 1
+ACTION_MERCH = 2
+ACTION_RIDE = 3
+
+def decide(now, last_bathroom_time, bathroom_interval, hunger, hunger_threshold,
+           food_chance, money, merch_probability, food_roll, merch_roll) -> int:
+    """
+    Pick a visitor's next action from plain numbers only.
+    The rolls are uniform [0, 1) draws supplied by the caller.
+    """
+    if now - last_bathroom_time >= bathroom_interval:
+        return ACTION_BATHROOM
+    if hunger > hunger_threshold and food_roll < food_chance:
+        return ACTION_FOOD
+    if money >= 5 and merch_roll < merch_probability:
+        return ACTION_MERCH
+    return ACTION_RIDE
+
+# Most finished visitors kept for reuse per visitor class
+POOL_LIMIT = 64
+
+# Random draws generated at once for the per-step hunger/energy/pause updates
+DRAW_BATCH = 64
+
+class SocialVisitor(ABC):
     """
     Visitor that can be part of a group.
     Groups coordinate activities and try to stay together.
+    Finished visitors go back to a per-class free list and are reused
+    by acquire() instead of building a new object for every arrival.
+    Subclasses tune decide() through HUNGER_THRESHOLD and FOOD_CHANCE.
     """
+    __slots__ = (
+        'vid', 'park', 'clock', 'metrics',
+        'location_tracker', 'group_manager', 'group_coordinator', '_group',
+        'last_bathroom_time', 'bathroom_interval', 'height_cm', 'money',
+        'ride_strategy', 'hunger', 'energy', 'merch_probability', 'has_fastpass',
+        'waiting_for_group', 'profile', 'eligible_ride_mask', '_loc_slot',
+        '_rand', '_callback_rand', '_np_rng', '_served_event',
+        '_hunger_draws', '_energy_draws', '_pause_draws', '_pick_draws',
+        '_food_draws', '_merch_draws', '_draw_i',
+    )
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._free = deque()  # Released instances of this class, oldest first
+        cls._pref_weights = ((), (), {})  # (rides tuple, weight by ride.bit, tables by mask)
+    
     def __init__(self, vid, park, clock, metrics=None, 
                  location_tracker=None, group_manager=None,
                  group_coordinator=None):
-        super().__init__(daemon=True)
+        self._rand = random.Random()  # Kept across reuse, reseeded by reset()
+        self._callback_rand = random.Random()  # Only drawn from by facility threads
+        self._served_event = ServedEvent()
+        self.reset(vid, park, clock, metrics, location_tracker, group_manager, group_coordinator)
+        self._update_ride_mask()
+    
+    @classmethod
+    def acquire(cls, vid, park, clock, metrics=None,
+                location_tracker=None, group_manager=None, group_coordinator=None):
+        """Get a visitor of this class, reusing a released one if available"""
+        try:
+            visitor = cls._free.popleft()
+        except IndexError:
+            visitor = cls(vid, park, clock, metrics, location_tracker, group_manager, group_coordinator)
+        else:
+            visitor.reset(vid, park, clock, metrics, location_tracker, group_manager, group_coordinator)
+            visitor._update_ride_mask()
+        
+        # Log group info
+        if _log.isEnabledFor(logging.DEBUG):
+            group_info = ""
+            group = visitor._group
+            if group is not None and group.size() > 1:
+                role = "leader" if group.is_leader(vid) else "member"
+                group_info = f" [Group {group.group_id}-{group.group_type.value}, {role}]"
+            
+            _log.debug(f"Visitor {vid} ({visitor.profile['kind']}){group_info} entering park...")
+        return visitor
+    
+    def release(self):
+        """Return this visitor to its class's free list"""
+        free = type(self)._free
+        if len(free) < POOL_LIMIT:
+            free.append(self)
+    
+    def reset(self, vid, park, clock, metrics=None,
+              location_tracker=None, group_manager=None, group_coordinator=None):
+        """(Re)initialise every field for a new arrival"""
         self.vid = vid
         self.park = park
         self.clock = clock
@@ -30,31 +128,79 @@ class SocialVisitor(threading.Thread, ABC):
         self.group_manager = group_manager
         self.group_coordinator = group_coordinator
         
+        # Our own [type, name] location cell; moving is two plain stores
+        self._loc_slot = location_tracker.register(vid) if location_tracker else None
+        
+        # Groups are formed before anyone arrives, so look ours up once
+        self._group = group_manager.get_visitor_group(vid) if group_manager else None
+        
+        # Private random streams seeded from the visitor id, so runs repeat.
+        # Ride and food callbacks run on facility threads and get a stream
+        # of their own, so their draws never interleave with ours.
+        seed = vid * 2654435761 & 0xFFFFFFFF
+        self._rand.seed(seed)
+        self._callback_rand.seed(seed ^ 0x5BD1E995)
+        self._np_rng = np.random.default_rng(seed)
+        
         # Standard attributes
         self.last_bathroom_time = 0
         self.bathroom_interval = 180
         self.height_cm = 160
-        self.money = random.randint(20, 200)
+        self.money = self._rand.randint(20, 200)
         self.ride_strategy: RideChoiceStrategy = PreferenceStrategy()
         
         # State
-        self.hunger = random.randint(0, 3)
-        self.energy = random.randint(7, 10)
+        self.hunger = self._rand.randint(0, 3)
+        self.energy = self._rand.randint(7, 10)
         self.merch_probability = 0.1
-        self.has_fastpass = random.choice([True, False])
+        self.has_fastpass = bool(self._rand.getrandbits(1))
         
         # Group state
         self.waiting_for_group = False
         
-        # Preferences (set by subclasses)
-        self.ride_prefs = {}
+        # Profile (set by subclasses)
         self.profile = {}
         
+        self._refill_draws()
+    
+    def _update_ride_mask(self):
+        """Work out which of the park's rides this visitor is tall enough for (after reset)"""
+        self.eligible_ride_mask = self.park.height_mask(self.height_cm) if self.park else None
+    
+    def _refill_draws(self):
+        """Pre-draw the next batch of per-step random updates"""
+        rng = self._np_rng
+        self._hunger_draws = rng.uniform(0.3, 0.8, DRAW_BATCH).tolist()
+        self._energy_draws = rng.uniform(0.2, 0.5, DRAW_BATCH).tolist()
+        self._pause_draws = rng.integers(2, 6, DRAW_BATCH).tolist()
+        self._pick_draws = rng.integers(0, 1 << 30, DRAW_BATCH).tolist()
+        self._food_draws = rng.random(DRAW_BATCH).tolist()
+        self._merch_draws = rng.random(DRAW_BATCH).tolist()
+        self._draw_i = 0
+    
+    def _next_draw(self) -> int:
+        """Index of the next unused pre-drawn step update"""
+        i = self._draw_i
+        if i == DRAW_BATCH:
+            self._refill_draws()
+            i = 0
+        self._draw_i = i + 1
+        return i
+    
+    def _pick(self, options):
+        """
+        Pick one of options using this step's pre-drawn index.
+        A step makes at most one such pick, so it can share the step's draw.
+        """
+        return options[self._pick_draws[self._draw_i - 1] % len(options)]
+        
     def run(self):
-        """Main visitor behavior loop"""
+        """Main visitor behavior loop (a generator driven by the VisitorScheduler)"""
         # Update location to entrance
-        if self.location_tracker:
-            self.location_tracker.update_location(self.vid, Location.ENTRANCE, "MainGate")
+        slot = self._loc_slot
+        if slot is not None:
+            slot[1] = "MainGate"
+            slot[0] = Location.ENTRANCE
         
         # Record arrival
         if self.metrics:
@@ -64,21 +210,22 @@ class SocialVisitor(threading.Thread, ABC):
         # Main loop
         while not self.clock.should_stop() and self.energy > 0:
             now = self.clock.now()
+            i = self._next_draw()
             
             # Increase hunger, decrease energy
-            self.hunger += random.uniform(0.3, 0.8)
-            self.energy -= random.uniform(0.2, 0.5)
+            self.hunger += self._hunger_draws[i]
+            self.energy -= self._energy_draws[i]
             
             # Check if should wait for group
             if self.group_coordinator and self.group_coordinator.should_wait_for_group(self.vid):
-                self._wait_for_group()
+                yield from self._wait_for_group()
                 continue
             
             # Make decision (subclass implements)
-            self.step(now)
+            yield from self.step(now)
             
             # Wait before next decision
-            self.clock.sleep_minutes(random.randint(2, 5))
+            yield self._pause_draws[i]
         
         # Record exit
         if self.metrics:
@@ -89,28 +236,88 @@ class SocialVisitor(threading.Thread, ABC):
             self.location_tracker.remove_visitor(self.vid)
         if self.group_manager:
             self.group_manager.remove_visitor(self.vid)
+        self.release()
     
     def _wait_for_group(self):
         """Wait for group members"""
-        if self.group_manager and self.group_manager.is_in_group(self.vid):
-            group = self.group_manager.get_visitor_group(self.vid)
-            print(f"[GROUP] Visitor {self.vid} (Group {group.group_id} leader) waiting for members...")
+        group = self._group
+        if group is not None and group.size() > 1 and _log.isEnabledFor(logging.DEBUG):
+            _log.debug(f"[GROUP] Visitor {self.vid} (Group {group.group_id} leader) waiting for members...")
         
-        if self.location_tracker:
-            self.location_tracker.update_location(self.vid, Location.WANDERING, "waiting")
+        slot = self._loc_slot
+        if slot is not None:
+            slot[1] = "waiting"
+            slot[0] = Location.WANDERING
         
-        self.clock.sleep_minutes(random.randint(3, 8))
+        yield self._rand.randint(3, 8)
+    
+    # Ride name -> preference weight, shared by every visitor of the class
+    RIDE_PREFS = {}
+    
+    @classmethod
+    def ride_pref_weights(cls, rides):
+        """
+        Get RIDE_PREFS as a tuple indexed by ride.bit (0 = no preference).
+        Built once per class for a given park rides tuple.
+        """
+        built_for, weights, tables = cls._pref_weights
+        if built_for is not rides:
+            weights = tuple(cls.RIDE_PREFS.get(ride.name, 0) for ride in rides)
+            cls._pref_weights = (rides, weights, {})
+        return weights
+    
+    @classmethod
+    def ride_pref_table(cls, rides, mask):
+        """
+        Get (preferred rides, cumulative weights) for the rides in a bitmask.
+        Cached per class and mask; there are only as many masks as ride
+        open/closed combinations, so each is built once.
+        """
+        weights = cls.ride_pref_weights(rides)
+        tables = cls._pref_weights[2]
+        table = tables.get(mask)
+        if table is None:
+            preferred = []
+            cumulative = []
+            total = 0
+            bits = mask
+            while bits:
+                low = bits & -bits
+                bits ^= low
+                bit = low.bit_length() - 1
+                if weights[bit]:
+                    total += weights[bit]
+                    preferred.append(rides[bit])
+                    cumulative.append(total)
+            table = tables[mask] = (tuple(preferred), tuple(cumulative))
+        return table
+    
+    # How hungry a visitor must be before considering food, and the chance they then go
+    HUNGER_THRESHOLD = 5
+    FOOD_CHANCE = 0.5
     
-    @abstractmethod
     def step(self, now):
-        """Decision logic"""
-        pass
+        """Decision logic (a generator; delegates to go_to_* with yield from)"""
+        i = self._draw_i - 1  # This step's pre-drawn rolls
+        action = decide(now, self.last_bathroom_time, self.bathroom_interval,
+                        self.hunger, self.HUNGER_THRESHOLD, self.FOOD_CHANCE,
+                        self.money, self.merch_probability,
+                        self._food_draws[i], self._merch_draws[i])
+        
+        if action == ACTION_BATHROOM:
+            yield from self.go_to_bathroom()
+        elif action == ACTION_FOOD:
+            yield from self.go_to_food()
+        elif action == ACTION_MERCH:
+            yield from self.go_to_merch()
+        else:
+            yield from self.go_to_ride()
     
     def _choose_ride(self):
         """Choose a ride, possibly following group leader"""
         if self.group_coordinator:
             # Get all available rides
-            available_rides = [r.name for r in self.park.get_rides() if r.is_operational()]
+            available_rides = self.park.get_operational_ride_names()
             
             # Check if should follow leader
             preferred = self.group_coordinator.get_group_activity_preference(
@@ -119,37 +326,47 @@ class SocialVisitor(threading.Thread, ABC):
             
             if preferred:
                 # Find this ride
-                for ride in self.park.get_rides():
-                    if ride.name == preferred and ride.is_operational():
-                        group = self.group_manager.get_visitor_group(self.vid)
-                        print(f"[GROUP] Visitor {self.vid} following group {group.group_id} leader to {preferred}")
-                        return ride
+                ride = self.park.get_ride(preferred)
+                if ride is not None and ride.is_operational():
+                    if _log.isEnabledFor(logging.DEBUG):
+                        _log.debug(f"[GROUP] Visitor {self.vid} following group {self._group.group_id} leader to {preferred}")
+                    return ride
         
         # Default: use strategy
         return self.ride_strategy.pick_ride(self, self.park)
     
+    def _go_to_facility(self, kind, facility, join):
+        """
+        Shared visit flow for every facility kind: dirty the zone, move there,
+        log the group activity, join the queue and wait to be served.
+        """
+        zone, dirt, location, activity = _FACILITY_SPEC[kind]
+        park = self.park
+        
+        if zone and park.cleanliness_manager:
+            park.cleanliness_manager.degrade_zone_local(zone, dirt)
+        slot = self._loc_slot
+        if slot is not None:
+            slot[1] = facility.name
+            slot[0] = location
+        
+        # Track group activity
+        group = self._group
+        if activity and group is not None and group.size() > 1 and park.metrics:
+            park.metrics.record_group_activity_async(
+                group.group_id, activity, facility.name,
+                self.clock.now(), group.size()
+            )
+        
+        self._served_event.clear()
+        join(self, facility)
+        yield self._served_event
+    
     def go_to_ride(self):
         """Join a ride queue"""
         ride = self._choose_ride()
         if ride:
-            if self.park.cleanliness_manager:
-                self.park.cleanliness_manager.degrade_zone('rides', 0.5)
-            if self.location_tracker:
-                self.location_tracker.update_location(self.vid, Location.RIDE, ride.name)
-            
-            # Track group activity
-            if self.group_manager and self.group_manager.is_in_group(self.vid):
-                group = self.group_manager.get_visitor_group(self.vid)
-                if group and self.park.metrics:
-                    self.park.metrics.record_group_activity(
-                        group.group_id, 'ride', ride.name, 
-                        self.clock.now(), group.size()
-                    )
-            
-            self.park.join_ride_queue(self, ride)
-            
-            while ride.queue.check_person_in(self):
-                self.clock.sleep_minutes(1)
+            yield from self._go_to_facility('ride', ride, self.park.join_ride_queue)
     
     def go_to_bathroom(self):
         """Join bathroom queue"""
@@ -157,42 +374,18 @@ class SocialVisitor(threading.Thread, ABC):
         if not bathrooms:
             return
         
-        bathroom = random.choice(bathrooms)
-        if self.park.cleanliness_manager:
-            self.park.cleanliness_manager.degrade_zone('bathrooms', 1.0)
-        
-        if self.location_tracker:
-            self.location_tracker.update_location(self.vid, Location.BATHROOM, bathroom.name)
-        
-        self.park.join_bathroom_queue(self, bathroom)
-        
-        while bathroom.queue.check_person_in(self):
-            self.clock.sleep_minutes(1)
-        
+        yield from self._go_to_facility('bathroom', self._pick(bathrooms),
+                                        self.park.join_bathroom_queue)
         self.last_bathroom_time = self.clock.now()
     
     def go_to_food(self):
         """Join food queue"""
-        facility = random.choice(self.park.get_food_facilities())
-        if self.park.cleanliness_manager:
-            self.park.cleanliness_manager.degrade_zone('food_court', 0.8)
-        
-        if self.location_tracker:
-            self.location_tracker.update_location(self.vid, Location.FOOD, facility.name)
-        
-        # Track group activity
-        if self.group_manager and self.group_manager.is_in_group(self.vid):
-            group = self.group_manager.get_visitor_group(self.vid)
-            if group and self.park.metrics:
-                self.park.metrics.record_group_activity(
-                    group.group_id, 'food', facility.name,
-                    self.clock.now(), group.size()
-                )
-        
-        self.park.join_food_queue(self, facility)
+        facilities = self.park.get_food_facilities()
+        if not facilities:
+            return
         
-        while facility.queue.check_person_in(self):
-            self.clock.sleep_minutes(1)
+        yield from self._go_to_facility('food', self._pick(facilities),
+                                        self.park.join_food_queue)
     
     def go_to_merch(self):
         """Join merch queue"""
@@ -200,29 +393,17 @@ class SocialVisitor(threading.Thread, ABC):
         if not stands:
             return
         
-        stand = random.choice(stands)
-        
-        if self.location_tracker:
-            self.location_tracker.update_location(self.vid, Location.MERCH, stand.name)
-        
-        # Track group activity
-        if self.group_manager and self.group_manager.is_in_group(self.vid):
-            group = self.group_manager.get_visitor_group(self.vid)
-            if group and self.park.metrics:
-                self.park.metrics.record_group_activity(
-                    group.group_id, 'merch', stand.name,
-                    self.clock.now(), group.size()
-                )
-        
-        self.park.join_merch_queue(self, stand)
-        
-        while stand.queue.check_person_in(self):
-            self.clock.sleep_minutes(1)
+        yield from self._go_to_facility('merch', self._pick(stands),
+                                        self.park.join_merch_queue)
+    
+    def notify_served(self):
+        """Called by a facility when it takes this visitor out of its queue"""
+        self._served_event.set()
     
     def on_ride_finished(self, ride_name, minute):
         """Called when ride finishes"""
-        self.hunger += random.uniform(0.5, 1.5)
-        self.energy -= random.uniform(0.5, 1.0)
+        self.hunger += self._callback_rand.uniform(0.5, 1.5)
+        self.energy -= self._callback_rand.uniform(0.5, 1.0)
     
     def on_food_failed(self, stand_name, minute):
         """Called when food purchase fails"""
@@ -230,132 +411,78 @@ class SocialVisitor(threading.Thread, ABC):
     
     def on_food_served(self, facility_name, minute):
         """Called when food is served"""
-        self.hunger = max(0, self.hunger - random.uniform(4, 6))
-        self.energy = min(10, self.energy + random.uniform(1, 2))
+        self.hunger = max(0, self.hunger - self._callback_rand.uniform(4, 6))
+        self.energy = min(10, self.energy + self._callback_rand.uniform(1, 2))
 
 
 # Concrete Visitor Types
 
 class SocialChild(SocialVisitor):
-    def __init__(self, vid, park, clock, metrics=None,
-                 location_tracker=None, group_manager=None, group_coordinator=None):
-        super().__init__(vid, park, clock, metrics, location_tracker, group_manager, group_coordinator)
+    __slots__ = ()
+    
+    RIDE_PREFS = {
+        'SpinningTeacups': 5, 'BumperCars': 4,
+        'FerrisWheel': 3, 'CarouselHorses': 4
+    }
+    HUNGER_THRESHOLD = 5
+    FOOD_CHANCE = 0.5
+    
+    def reset(self, vid, park, clock, metrics=None,
+              location_tracker=None, group_manager=None, group_coordinator=None):
+        super().reset(vid, park, clock, metrics, location_tracker, group_manager, group_coordinator)
         self.profile = {'kind': 'Child'}
         self.merch_probability = 0.1
-        self.height_cm = random.randint(100, 140)
-        self.money = random.randint(10, 50)
-        self.ride_prefs = {
-            'SpinningTeacups': 5, 'BumperCars': 4,
-            'FerrisWheel': 3, 'CarouselHorses': 4
-        }
+        self.height_cm = self._rand.randint(100, 140)
+        self.money = self._rand.randint(10, 50)
         self.ride_strategy = RandomStrategy()
         self.bathroom_interval = 90
-    
-    def step(self, now):
-        if now - self.last_bathroom_time >= self.bathroom_interval:
-            self.go_to_bathroom()
-        elif self.hunger > 5 and random.random() < 0.5:
-            self.go_to_food()
-        elif self.money >= 5 and random.random() < self.merch_probability:
-            self.go_to_merch()
-        else:
-            self.go_to_ride()
 
 
 class SocialTourist(SocialVisitor):
-    def __init__(self, vid, park, clock, metrics=None,
-                 location_tracker=None, group_manager=None, group_coordinator=None):
-        super().__init__(vid, park, clock, metrics, location_tracker, group_manager, group_coordinator)
+    __slots__ = ()
+    
+    RIDE_PREFS = {
+        'FerrisWheel': 5, 'HauntedHouse': 3,
+        'RollerCoaster': 3, 'SplashMountain': 4
+    }
+    HUNGER_THRESHOLD = 7
+    FOOD_CHANCE = 0.4
+    
+    def reset(self, vid, park, clock, metrics=None,
+              location_tracker=None, group_manager=None, group_coordinator=None):
+        super().reset(vid, park, clock, metrics, location_tracker, group_manager, group_coordinator)
         self.profile = {'kind': 'Tourist'}
         self.bathroom_interval = 180
         self.merch_probability = 0.3
-        self.height_cm = random.randint(150, 190)
-        self.money = random.randint(100, 200)
-        self.ride_prefs = {
-            'FerrisWheel': 5, 'HauntedHouse': 3,
-            'RollerCoaster': 3, 'SplashMountain': 4
-        }
-    
-    def step(self, now):
-        if now - self.last_bathroom_time >= self.bathroom_interval:
-            self.go_to_bathroom()
-        elif self.hunger > 7 and random.random() < 0.4:
-            self.go_to_food()
-        elif self.money >= 5 and random.random() < self.merch_probability:
-            self.go_to_merch()
-        else:
-            self.go_to_ride()
+        self.height_cm = self._rand.randint(150, 190)
+        self.money = self._rand.randint(100, 200)
 
 
 class SocialAdrenalineAddict(SocialVisitor):
-    def __init__(self, vid, park, clock, metrics=None,
-                 location_tracker=None, group_manager=None, group_coordinator=None):
-        super().__init__(vid, park, clock, metrics, location_tracker, group_manager, group_coordinator)
+    __slots__ = ()
+    
+    RIDE_PREFS = {
+        'RollerCoaster': 5, 'DropTower': 5,
+        'SpaceSimulator': 4, 'SplashMountain': 3
+    }
+    HUNGER_THRESHOLD = 8
+    FOOD_CHANCE = 0.1
+    
+    def reset(self, vid, park, clock, metrics=None,
+              location_tracker=None, group_manager=None, group_coordinator=None):
+        super().reset(vid, park, clock, metrics, location_tracker, group_manager, group_coordinator)
         self.profile = {'kind': 'AdrenalineAddict'}
         self.bathroom_interval = 240
         self.merch_probability = 0.025
-        self.height_cm = random.randint(140, 200)
-        self.money = random.randint(10, 100)
-        self.ride_prefs = {
-            'RollerCoaster': 5, 'DropTower': 5,
-            'SpaceSimulator': 4, 'SplashMountain': 3
-        }
-    
-    def step(self, now):
-        if now - self.last_bathroom_time >= self.bathroom_interval:
-            self.go_to_bathroom()
-        elif self.hunger > 8 and random.random() < 0.1:
-            self.go_to_food()
-        elif self.money >= 5 and random.random() < self.merch_probability:
-            self.go_to_merch()
-        else:
-            self.go_to_ride()
-
-
-# Factories
-
-class SocialVisitorCreator(ABC):
-    @abstractmethod
-    def factory_method(self, vid, park, clock, metrics,
-                      location_tracker, group_manager, group_coordinator):
-        pass
-        
-    def register_visitor(self, vid, park, clock, metrics, **kwargs):
-        location_tracker = kwargs.get('location_tracker')
-        group_manager = kwargs.get('group_manager')
-        group_coordinator = kwargs.get('group_coordinator')
-        
-        visitor = self.factory_method(vid, park, clock, metrics,
-                                     location_tracker, group_manager, group_coordinator)
-        
-        # Print group info
-        group_info = ""
-        if group_manager:
-            group = group_manager.get_visitor_group(vid)
-            if group and group.size() > 1:
-                role = "leader" if group.is_leader(vid) else "member"
-                group_info = f" [Group {group.group_id}-{group.group_type.value}, {role}]"
-        
-        print(f"Visitor {vid} ({visitor.profile['kind']}){group_info} entering park...")
-        return visitor
-
-
-class SocialChildCreator(SocialVisitorCreator):
-    def factory_method(self, vid, park, clock, metrics,
-                      location_tracker, group_manager, group_coordinator):
-        return SocialChild(vid, park, clock, metrics,
-                          location_tracker, group_manager, group_coordinator)
-
+        self.height_cm = self._rand.randint(140, 200)
+        self.money = self._rand.randint(10, 100)
 
-class SocialTouristCreator(SocialVisitorCreator):
-    def factory_method(self, vid, park, clock, metrics,
-                      location_tracker, group_manager, group_coordinator):
-        return SocialTourist(vid, park, clock, metrics,
-                            location_tracker, group_manager, group_coordinator)
 
+# Constructors
 
-class SocialAdrenalineAddictCreator(SocialVisitorCreator):
-    def factory_method(self, vid, park, clock, metrics,
-                      location_tracker, group_manager, group_coordinator):
-        return SocialAdrenalineAddict(vid, park, clock, metrics,
-                                     location_tracker, group_manager, group_coordinator)
\ No newline at end of file
+# Visitor type name -> pooled constructor, looked up once per arrival
+VISITOR_CTORS = {
+    'Child': SocialChild.acquire,
+    'Tourist': SocialTourist.acquire,
+    'AdrenalineAddict': SocialAdrenalineAddict.acquire
+}
@@ -3,11 +3,14 @@ Staff Management System
 =======================
 Adds employees to the park: ride operators, security, and janitors.
 Staff affect park operations and visitor satisfaction.
+Staff run as cooperative tasks on the park's scheduler: run(), work_cycle()
+and their helpers are generators that yield simulated minutes to sleep.
 """
 
 import threading
 import random
-from enum import Enum
+import numpy as np
+from enum import Enum, IntEnum
 from abc import ABC, abstractmethod
 from collections import defaultdict
 
@@ -19,70 +22,114 @@ class StaffType(Enum):
     SECURITY = "security"
     JANITOR = "janitor"
 
-class StaffSkill(Enum):
-    """Skill levels for staff"""
-    TRAINEE = "trainee"      # Slower, less efficient
-    REGULAR = "regular"      # Normal performance
-    EXPERIENCED = "experienced"  # Faster, more efficient
-    EXPERT = "expert"        # Best performance
+class StaffSkill(IntEnum):
+    """Skill levels for staff (values index Staff.PERFORMANCE_LUT)"""
+    TRAINEE = 0      # Slower, less efficient
+    REGULAR = 1      # Normal performance
+    EXPERIENCED = 2  # Faster, more efficient
+    EXPERT = 3       # Best performance
 
 
 # Base Staff Class
 
-class Staff(threading.Thread, ABC):
+# Pauses between tasks drawn at once per staff member
+JITTER_BATCH = 256
+
+class Staff(ABC):
     """Base class for all staff members"""
+    __slots__ = (
+        'staff_id', 'name', 'clock', 'park', 'skill_level',
+        '_rand', '_np_rng', '_jitter', '_jitter_i', '_metrics', 'manager',
+        'energy', 'on_duty', 'current_task', '_base_perf',
+    )
+    
+    # Performance multiplier for each skill level, indexed by StaffSkill
+    PERFORMANCE_LUT = (0.7, 1.0, 1.3, 1.6)
+    
+    # Which StaffManager bucket this kind of staff goes in; set by each subclass
+    STAFF_TYPE = None
+    
     def __init__(self, staff_id, name, clock, park, skill_level=StaffSkill.REGULAR):
-        super().__init__(daemon=True)
         self.staff_id = staff_id
         self.name = name
         self.clock = clock
         self.park = park
         self.skill_level = skill_level
         
+        # The park's metrics never change once staff are hired
+        self._metrics = getattr(park, 'metrics', None)
+        
+        # Set by StaffManager.add_staff; keeps park-wide totals
+        self.manager = None
+        
+        # Private random streams seeded from the staff id, so runs repeat
+        seed = staff_id * 2654435761 & 0xFFFFFFFF
+        self._rand = random.Random(seed)
+        self._np_rng = np.random.default_rng(seed)
+        self._refill_jitter()
+        
         # Staff state
         self.energy = 100  # Decreases over shift
         self.on_duty = True
         self.current_task = None
         
-        # Performance multipliers based on skill
-        self.performance_multipliers = {
-            StaffSkill.TRAINEE: 0.7,
-            StaffSkill.REGULAR: 1.0,
-            StaffSkill.EXPERIENCED: 1.3,
-            StaffSkill.EXPERT: 1.6
-        }
+        # Skill never changes, so look its multiplier up once (as a percentage
+        # multiplier, so efficiency is a single multiply by energy)
+        self._base_perf = self.PERFORMANCE_LUT[skill_level] * 0.01
         
     def get_efficiency(self) -> float:
         """Calculate current efficiency (0.0 to 1.6)"""
-        base = self.performance_multipliers[self.skill_level]
         # Energy affects efficiency
-        energy_factor = self.energy / 100.0
-        return base * energy_factor
+        return self._base_perf * self.energy
     
     def rest(self):
         """Take a break to restore energy"""
         self.current_task = "resting"
-        rest_time = random.randint(10, 20)
-        self.clock.sleep_minutes(rest_time)
+        rest_time = self._rand.randint(10, 20)
+        yield rest_time
         self.energy = min(100, self.energy + 30)
         self.current_task = None
     
+    def _refill_jitter(self):
+        """Pre-draw the next batch of 1-3 minute pauses between tasks"""
+        self._jitter = self._np_rng.integers(1, 4, JITTER_BATCH).tolist()
+        self._jitter_i = 0
+    
+    def _next_pause(self) -> int:
+        """Next pre-drawn pause between tasks"""
+        i = self._jitter_i
+        if i == JITTER_BATCH:
+            self._refill_jitter()
+            i = 0
+        self._jitter_i = i + 1
+        return self._jitter[i]
+    
+    def _tally(self, counter):
+        """Bump one of this member's performance counters and the manager's total"""
+        setattr(self, counter, getattr(self, counter) + 1)
+        if self.manager is not None:
+            self.manager.record(counter)
+    
     @abstractmethod
     def work_cycle(self):
-        """Main work cycle - implemented by subclasses"""
+        """Main work cycle - implemented by subclasses (a generator)"""
         pass
     
+    def start(self):
+        """Start working on the park's shared scheduler"""
+        self.park.start_task(self.run())
+    
     def run(self):
-        """Main thread loop"""
+        """Main staff loop (a generator driven by the park's scheduler)"""
         while not self.clock.should_stop() and self.on_duty:
             # Check if needs rest
-            if self.energy < 30 and random.random() < 0.7:
-                self.rest()
+            if self.energy < 30 and self._rand.random() < 0.7:
+                yield from self.rest()
             else:
-                self.work_cycle()
+                yield from self.work_cycle()
             
             # Small pause between tasks
-            self.clock.sleep_minutes(random.randint(1, 3))
+            yield self._next_pause()
 
 # Ride Operator
 
@@ -91,6 +138,9 @@ class RideOperator(Staff):
     Operates a specific ride.
     Skilled operators reduce boarding time and improve ride efficiency.
     """
+    __slots__ = ('assigned_ride', 'rides_operated')
+    STAFF_TYPE = StaffType.RIDE_OPERATOR
+    
     def __init__(self, staff_id, name, clock, park, assigned_ride, 
                  skill_level=StaffSkill.REGULAR):
         super().__init__(staff_id, name, clock, park, skill_level)
@@ -105,7 +155,7 @@ class RideOperator(Staff):
         if not self.assigned_ride.is_operational():
             # Ride is broken or in maintenance
             self.current_task = "waiting for ride repair"
-            self.clock.sleep_minutes(5)
+            yield 5
             return
         
         # Optimize boarding if there's a queue
@@ -115,19 +165,19 @@ class RideOperator(Staff):
             efficiency = self.get_efficiency()
             if efficiency > 1.0:
                 # Could reduce board_window, but we'll just track performance
-                self.rides_operated += 1
+                self._tally('rides_operated')
                 # Track in metrics
-                if hasattr(self.park, 'metrics') and self.park.metrics:
-                    self.park.metrics.record_staff_action(
+                if self._metrics is not None:
+                    self._metrics.record_staff_action(
                         self.staff_id, self.name, "ride_operator", "operated_ride",
                         self.assigned_ride.name, self.clock.now(), efficiency
                     )
         
         # Decrease energy
-        self.energy -= random.uniform(1, 3)
+        self.energy -= self._rand.uniform(1, 3)
         
         # Monitor ride
-        self.clock.sleep_minutes(random.randint(3, 7))
+        yield self._rand.randint(3, 7)
 
 # Security Guard
 
@@ -135,6 +185,9 @@ class SecurityGuard(Staff):
     """
     Patrols the park, handles incidents, finds lost children.
     """
+    __slots__ = ('patrol_area', 'incidents_handled', 'children_found')
+    STAFF_TYPE = StaffType.SECURITY
+    
     def __init__(self, staff_id, name, clock, park, patrol_area,
                  skill_level=StaffSkill.REGULAR):
         super().__init__(staff_id, name, clock, park, skill_level)
@@ -147,16 +200,16 @@ class SecurityGuard(Staff):
         self.current_task = f"patrolling {self.patrol_area}"
         
         # Check for lost children (random events)
-        if random.random() < 0.05:  # 5% chance per cycle
-            self._handle_lost_child()
+        if self._rand.random() < 0.05:  # 5% chance per cycle
+            yield from self._handle_lost_child()
         
         # Check for incidents (random events)
-        if random.random() < 0.03:  # 3% chance per cycle
-            self._handle_incident()
+        if self._rand.random() < 0.03:  # 3% chance per cycle
+            yield from self._handle_incident()
         
         # Regular patrol
-        self.energy -= random.uniform(0.5, 1.5)
-        self.clock.sleep_minutes(random.randint(5, 10))
+        self.energy -= self._rand.uniform(0.5, 1.5)
+        yield self._rand.randint(5, 10)
     
     def _handle_lost_child(self):
         """Handle a lost child event"""
@@ -166,14 +219,14 @@ class SecurityGuard(Staff):
         print(f"[SECURITY] {self.name} searching for lost child in {self.patrol_area}...")
         self.current_task = "searching for lost child"
         
-        self.clock.sleep_minutes(search_time)
+        yield search_time
         
-        if random.random() < 0.8 + (efficiency * 0.1):  # Higher skill = better success
-            self.children_found += 1
+        if self._rand.random() < 0.8 + (efficiency * 0.1):  # Higher skill = better success
+            self._tally('children_found')
             print(f"[SECURITY] {self.name} reunited lost child with family!")
             # Track in metrics
-            if hasattr(self.park, 'metrics') and self.park.metrics:
-                self.park.metrics.record_staff_action(
+            if self._metrics is not None:
+                self._metrics.record_staff_action(
                     self.staff_id, self.name, "security", "found_child",
                     self.patrol_area, self.clock.now(), efficiency
                 )
@@ -185,7 +238,7 @@ class SecurityGuard(Staff):
     def _handle_incident(self):
         """Handle a security incident"""
         incident_types = ["dispute", "medical", "disturbance", "safety_concern"]
-        incident = random.choice(incident_types)
+        incident = self._rand.choice(incident_types)
         
         print(f"[SECURITY] {self.name} responding to {incident} in {self.patrol_area}")
         self.current_task = f"handling {incident}"
@@ -193,15 +246,15 @@ class SecurityGuard(Staff):
         efficiency = self.get_efficiency()
         resolution_time = int(20 / efficiency)
         
-        self.clock.sleep_minutes(resolution_time)
-        self.incidents_handled += 1
+        yield resolution_time
+        self._tally('incidents_handled')
         self.energy -= 8
         
         print(f"[SECURITY] {self.name} resolved {incident}")
         
         # Track in metrics
-        if hasattr(self.park, 'metrics') and self.park.metrics:
-            self.park.metrics.record_staff_action(
+        if self._metrics is not None:
+            self._metrics.record_staff_action(
                 self.staff_id, self.name, "security", f"incident_{incident}",
                 self.patrol_area, self.clock.now(), efficiency
             )
@@ -213,6 +266,9 @@ class Janitor(Staff):
     Cleans the park. Cleanliness affects visitor satisfaction.
     Areas get dirty over time based on visitor traffic.
     """
+    __slots__ = ('assigned_zone', 'areas_cleaned')
+    STAFF_TYPE = StaffType.JANITOR
+    
     def __init__(self, staff_id, name, clock, park, assigned_zone,
                  skill_level=StaffSkill.REGULAR):
         super().__init__(staff_id, name, clock, park, skill_level)
@@ -230,38 +286,38 @@ class Janitor(Staff):
             )
             
             if cleanliness < 70:  # Needs cleaning
-                self._clean_zone()
+                yield from self._clean_zone()
             else:
                 # Routine maintenance
                 self.current_task = f"maintaining {self.assigned_zone}"
-                self.clock.sleep_minutes(random.randint(3, 6))
+                yield self._rand.randint(3, 6)
         else:
             # No cleanliness system, just simulate work
-            self.clock.sleep_minutes(random.randint(5, 10))
+            yield self._rand.randint(5, 10)
         
-        self.energy -= random.uniform(1, 2)
+        self.energy -= self._rand.uniform(1, 2)
     
     def _clean_zone(self):
         """Clean the assigned zone"""
         efficiency = self.get_efficiency()
         clean_time = int(10 / efficiency)  # Skilled janitors clean faster
         
-        if random.random() < 0.1:  # 10% chance of visible cleaning
+        if self._rand.random() < 0.1:  # 10% chance of visible cleaning
             print(f"[CLEANING] {self.name} deep cleaning {self.assigned_zone}")
         
-        self.clock.sleep_minutes(clean_time)
+        yield clean_time
         
         # Improve cleanliness
         if self.park.cleanliness_manager:
             improvement = 20 * efficiency
             self.park.cleanliness_manager.clean_zone(self.assigned_zone, improvement)
         
-        self.areas_cleaned += 1
+        self._tally('areas_cleaned')
         self.energy -= 5
         
         # Track in metrics
-        if hasattr(self.park, 'metrics') and self.park.metrics:
-            self.park.metrics.record_staff_action(
+        if self._metrics is not None:
+            self._metrics.record_staff_action(
                 self.staff_id, self.name, "janitor", "cleaned_zone",
                 self.assigned_zone, self.clock.now(), efficiency
             )
@@ -272,74 +328,127 @@ class CleanlinessManager:
     """
     Tracks cleanliness of different park zones.
     Visitors decrease cleanliness, janitors increase it.
+    Zone levels and traffic counts are NumPy arrays indexed by zone.
     """
+    ZONE_NAMES = ('rides', 'food_court', 'bathrooms', 'pathways', 'entrance')
+    
     def __init__(self, metrics=None):
         self._lock = threading.Lock()
         self.metrics = metrics
         
-        # Zone cleanliness (0-100)
-        self._zones = {
-            'rides': 100,
-            'food_court': 100,
-            'bathrooms': 100,
-            'pathways': 100,
-            'entrance': 100
-        }
+        # Zone cleanliness (0-100), indexed through _zone_idx
+        self._zone_idx = {name: i for i, name in enumerate(self.ZONE_NAMES)}
+        self._zones = np.full(len(self.ZONE_NAMES), 100.0)
         
         # Track visitor traffic
-        self._traffic_count = defaultdict(int)
+        self._traffic_count = np.zeros(len(self.ZONE_NAMES), dtype=np.int64)
+        
+        # Per-thread visitor degradation, applied before anyone reads the zones.
+        # Each thread owns a shard of running totals, [dirt per zone...,
+        # visits per zone...], that only it writes and that only ever grows;
+        # readers fold in the change since the totals they last saw.
+        self._local = threading.local()
+        self._shards = []  # Every thread's shard, in registration order
+        self._seen = np.zeros((0, 2 * len(self.ZONE_NAMES)))  # Last folded totals, row per shard
+        self._shards_lock = threading.Lock()
     
     def get_zone_cleanliness(self, zone: str) -> float:
         """Get cleanliness of a zone (0-100)"""
+        idx = self._zone_idx.get(zone)
+        if idx is None:
+            return 100
         with self._lock:
-            return self._zones.get(zone, 100)
+            self._apply_pending()
+            return float(self._zones[idx])
     
     def clean_zone(self, zone: str, improvement: float):
         """Increase cleanliness of a zone"""
+        idx = self._zone_idx.get(zone)
+        if idx is None:
+            return
         with self._lock:
-            if zone in self._zones:
-                self._zones[zone] = min(100, self._zones[zone] + improvement)
+            self._apply_pending()
+            self._zones[idx] = min(100.0, self._zones[idx] + improvement)
     
     def degrade_zone(self, zone: str, amount: float):
-        """Decrease cleanliness (from visitor traffic)"""
-        with self._lock:
-            if zone in self._zones:
-                self._zones[zone] = max(0, self._zones[zone] - amount)
-                self._traffic_count[zone] += 1
+        """
+        Decrease cleanliness (from visitor traffic).
+        Recorded per thread and merged under the lock on the next read.
+        """
+        self.degrade_zone_local(zone, amount)
+    
+    def degrade_zone_local(self, zone: str, amount: float):
+        """
+        Record visitor degradation on the calling thread without locking.
+        It is applied to the zones the next time they are read or cleaned.
+        """
+        idx = self._zone_idx.get(zone)
+        if idx is None:
+            return
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = [0.0] * (2 * len(self.ZONE_NAMES))
+            with self._shards_lock:
+                self._shards.append(shard)
+        shard[idx] += amount
+        shard[len(self.ZONE_NAMES) + idx] += 1
+    
+    def _apply_pending(self):
+        """Fold every thread's recorded degradation into the zones (caller holds the lock)"""
+        with self._shards_lock:
+            shards = list(self._shards)
+        if not shards:
+            return
+        
+        # Owners keep adding, so work from one copy of each shard
+        totals = np.array([shard[:] for shard in shards])
+        seen = self._seen
+        if len(seen) < len(totals):
+            seen = self._seen = np.vstack(
+                [seen, np.zeros((len(totals) - len(seen), seen.shape[1]))]
+            )
+        delta = (totals - seen[:len(totals)]).sum(axis=0)
+        seen[:len(totals)] = totals
+        
+        # Amounts are never negative, so clamping once after summing
+        # gives the same result as clamping after every visitor
+        size = len(self.ZONE_NAMES)
+        self._zones -= delta[:size]
+        np.maximum(self._zones, 0.0, out=self._zones)
+        self._traffic_count += np.rint(delta[size:]).astype(np.int64)
     
-    def periodic_degradation(self, clock):
-        """Background thread that degrades cleanliness over time"""
-        while not clock.should_stop():
-            with self._lock:
-                for zone in self._zones:
-                    # Degrade based on traffic
-                    traffic = self._traffic_count.get(zone, 0)
-                    degradation = min(5, traffic * 0.1)
-                    self._zones[zone] = max(0, self._zones[zone] - degradation)
-                    
-                    # Log cleanliness to metrics
-                    if self.metrics:
-                        self.metrics.record_cleanliness(
-                            zone, self._zones[zone], clock.now()
-                        )
-                    
-                # Reset traffic count
-                self._traffic_count.clear()
+    def degrade_once(self, clock):
+        """Apply one round of traffic-based degradation to every zone"""
+        with self._lock:
+            self._apply_pending()
+            # Degrade based on traffic
+            degradation = np.minimum(5, self._traffic_count * 0.1)
+            np.maximum(self._zones - degradation, 0.0, out=self._zones)
             
-            clock.sleep_minutes(10)  # Check every 10 minutes
+            # Log cleanliness to metrics
+            if self.metrics:
+                now = clock.now()
+                for zone, level in zip(self.ZONE_NAMES, self._zones.tolist()):
+                    self.metrics.record_cleanliness(zone, level, now)
+                
+            # Reset traffic count
+            self._traffic_count.fill(0)
     
     def get_average_cleanliness(self) -> float:
         """Get park-wide average cleanliness"""
         with self._lock:
-            return sum(self._zones.values()) / len(self._zones)
+            self._apply_pending()
+            return float(self._zones.mean())
     
     def get_summary(self) -> dict:
         """Get cleanliness summary"""
         with self._lock:
-            return {
-                'zones': dict(self._zones),
-                'average': self.get_average_cleanliness()
-            }
+            self._apply_pending()
+            levels = self._zones.tolist()
+        return {
+            'zones': dict(zip(self.ZONE_NAMES, levels)),
+            'average': sum(levels) / len(levels)
+        }
 
 # Staff Manager
 
@@ -347,26 +456,40 @@ class StaffManager:
     """
     Manages all park staff members.
     Tracks performance and coordinates staff activities.
+    Performance totals are kept up to date as staff act, so reading
+    the statistics doesn't walk every staff member.
     """
     def __init__(self):
         self._lock = threading.Lock()
         self._staff = []
         self._staff_by_type = defaultdict(list)
         
+        # Park-wide performance totals, bumped through record()
+        self._stats_lock = threading.Lock()
+        self._counters = {
+            'rides_operated': 0,
+            'incidents_handled': 0,
+            'children_found': 0,
+            'areas_cleaned': 0
+        }
+        
     def add_staff(self, staff: Staff):
         """Add a staff member"""
+        staff_type = staff.STAFF_TYPE
+        if staff_type is None:
+            raise ValueError(f"Staff {staff.name} has no STAFF_TYPE")
         with self._lock:
             self._staff.append(staff)
-            # Determine type
-            if isinstance(staff, RideOperator):
-                self._staff_by_type[StaffType.RIDE_OPERATOR].append(staff)
-            elif isinstance(staff, SecurityGuard):
-                self._staff_by_type[StaffType.SECURITY].append(staff)
-            elif isinstance(staff, Janitor):
-                self._staff_by_type[StaffType.JANITOR].append(staff)
+            staff.manager = self
+            self._staff_by_type[staff_type].append(staff)
+    
+    def record(self, counter: str):
+        """Add one to a park-wide performance total"""
+        with self._stats_lock:
+            self._counters[counter] += 1
     
     def start_all_staff(self):
-        """Start all staff threads"""
+        """Start all staff members on the park's scheduler"""
         with self._lock:
             for staff in self._staff:
                 staff.start()
@@ -380,6 +503,9 @@ class StaffManager:
     
     def get_statistics(self) -> dict:
         """Get staff performance statistics"""
+        with self._stats_lock:
+            counters = dict(self._counters)
+        
         with self._lock:
             stats = {
                 'total_staff': len(self._staff),
@@ -391,21 +517,19 @@ class StaffManager:
                 stats['by_type'][staff_type.value] = len(staff_list)
             
             # Ride operators
-            operators = self._staff_by_type[StaffType.RIDE_OPERATOR]
-            if operators:
-                total_rides = sum(op.rides_operated for op in operators)
+            num_operators = len(self._staff_by_type.get(StaffType.RIDE_OPERATOR, ()))
+            if num_operators:
+                total_rides = counters['rides_operated']
                 stats['performance']['total_rides_operated'] = total_rides
-                stats['performance']['avg_rides_per_operator'] = total_rides / len(operators)
+                stats['performance']['avg_rides_per_operator'] = total_rides / num_operators
             
             # Security
-            guards = self._staff_by_type[StaffType.SECURITY]
-            if guards:
-                stats['performance']['incidents_handled'] = sum(g.incidents_handled for g in guards)
-                stats['performance']['children_found'] = sum(g.children_found for g in guards)
+            if self._staff_by_type.get(StaffType.SECURITY):
+                stats['performance']['incidents_handled'] = counters['incidents_handled']
+                stats['performance']['children_found'] = counters['children_found']
             
             # Janitors
-            janitors = self._staff_by_type[StaffType.JANITOR]
-            if janitors:
-                stats['performance']['areas_cleaned'] = sum(j.areas_cleaned for j in janitors)
+            if self._staff_by_type.get(StaffType.JANITOR):
+                stats['performance']['areas_cleaned'] = counters['areas_cleaned']
             
-            return stats
\ No newline at end of file
+            return stats
@@ -3,6 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Optional
 import random
+from bisect import bisect_right
 from .ride import Ride
 
 class RideChoiceStrategy(ABC):
@@ -13,28 +14,40 @@ class RideChoiceStrategy(ABC):
 
 def _eligible_rides(visitor, park):
     """Helper: operational rides where visitor meets height requirements."""
-    height = getattr(visitor, "height_cm", 0)
-    rides = []
-    for r in park.get_rides():
-        if not r.is_operational():
-            continue
-        min_h = getattr(r, "min_height_cm", 0)
-        if height >= min_h:
-            rides.append(r)
-    return rides
+    mask = getattr(visitor, "eligible_ride_mask", None)
+    if mask is None:
+        mask = park.height_mask(getattr(visitor, "height_cm", 0))
+    # AND the height mask with the park's operational mask; the park
+    # memoizes the ride tuple for each combination
+    return park.rides_in_mask(mask & park.get_operational_mask())
 
 class RandomStrategy(RideChoiceStrategy):
     """Pure random choice among operational rides the visitor is tall enough for."""
     def pick_ride(self, visitor, park):
         rides = _eligible_rides(visitor, park)
-        return random.choice(rides) if rides else None
+        return getattr(visitor, "_rand", random).choice(rides) if rides else None
 
 class PreferenceStrategy(RideChoiceStrategy):
     """
-    Weighted by visitor.ride_prefs, only among rides the visitor can legally ride.
+    Weighted by the visitor's ride preferences, only among rides the visitor can legally ride.
     Falls back to random among eligible rides if no prefs match.
     """
     def pick_ride(self, visitor, park):
+        # Use the visitor's own random stream when it has one
+        rand = getattr(visitor, "_rand", random)
+
+        pref_table = getattr(visitor, "ride_pref_table", None)
+        mask = getattr(visitor, "eligible_ride_mask", None)
+        if pref_table is not None and mask is not None:
+            mask &= park.get_operational_mask()
+            if not mask:
+                return None
+            # Cached per class and mask, so a pick is one draw and a bisect
+            preferred, cumulative = pref_table(park.get_rides(), mask)
+            if preferred:
+                return preferred[bisect_right(cumulative, rand.random() * cumulative[-1])]
+            return rand.choice(_eligible_rides(visitor, park))
+
         rides = _eligible_rides(visitor, park)
         if not rides:
             return None
@@ -44,8 +57,8 @@ class PreferenceStrategy(RideChoiceStrategy):
 
         # If we have no preference info, just pick any eligible ride
         if not preferred:
-            return random.choice(rides)
+            return rand.choice(rides)
 
         # Weighted random based on preferences
-        weights = [prefs.get(r.name, 1.0) for r in preferred]
-        return random.choices(preferred, weights=weights, k=1)[0]
\ No newline at end of file
+        weights = [prefs[r.name] for r in preferred]
+        return rand.choices(preferred, weights=weights, k=1)[0]
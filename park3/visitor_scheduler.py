@@ -0,0 +1,156 @@
+"""
+Visitor Scheduler
+=================
+Runs visitors as cooperative tasks on a small worker pool instead of
+giving each visitor its own thread.
+A visitor's run() is a generator that yields how many simulated minutes
+it wants to sleep; the scheduler resumes it once that time has passed.
+It can also yield a ServedEvent to sleep until a facility serves it.
+Food trucks, merch stands, bathrooms and staff are scheduled the same way.
+"""
+
+import os
+import time
+import heapq
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ServedEvent:
+    """
+    Signal a facility sets when it takes a visitor out of its queue.
+    A visitor task yields it to stay parked, without polling, until then.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._set = False
+        self._waiter = None  # Resumes the parked task once set
+    
+    def set(self):
+        """Mark the visitor as served and resume it if it is parked"""
+        with self._lock:
+            self._set = True
+            waiter, self._waiter = self._waiter, None
+        if waiter is not None:
+            waiter()
+    
+    def clear(self):
+        """Re-arm before joining another queue"""
+        with self._lock:
+            self._set = False
+    
+    def is_set(self):
+        """Check if the visitor has been served"""
+        return self._set
+    
+    def park_until_set(self, resume) -> bool:
+        """Call resume once set; returns False (and doesn't) if already set"""
+        with self._lock:
+            if self._set:
+                return False
+            self._waiter = resume
+            return True
+
+
+class VisitorScheduler:
+    """
+    Keeps sleeping visitors in a min-heap keyed by wake-up time.
+    A single dispatcher thread hands due visitors to the worker pool.
+    """
+    def __init__(self, clock, max_workers=None):
+        self.clock = clock
+        self._heap = []  # (wake_time, seq, task), wake_time in real seconds
+        self._seq = itertools.count()  # Tie-breaker so tasks are never compared
+        self._cond = threading.Condition()
+        self._running = False
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers or os.cpu_count() or 4,
+            thread_name_prefix="visitor"
+        )
+        self._dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+
+    def start(self):
+        """Start the dispatcher thread"""
+        self._running = True
+        self._dispatcher.start()
+
+    def add(self, visitor):
+        """Start running a visitor's behaviour loop"""
+        self.add_task(visitor.run())
+    
+    def add_task(self, task):
+        """Start running any generator that yields sleep times"""
+        self._push(time.monotonic(), task)
+
+    def stop(self):
+        """Stop dispatching; pending visitors get one last step to leave"""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+
+    def _push(self, wake_time, task):
+        """Queue a task to be resumed at wake_time"""
+        with self._cond:
+            heapq.heappush(self._heap, (wake_time, next(self._seq), task))
+            if self._heap[0][2] is task:
+                self._cond.notify()
+
+    def _dispatch(self):
+        """Hand due tasks to the pool until the simulation stops"""
+        while self._running and not self.clock.should_stop():
+            due = []
+            with self._cond:
+                now = time.monotonic()
+                while self._heap and self._heap[0][0] <= now:
+                    due.append(heapq.heappop(self._heap)[2])
+                if not due:
+                    # Cap the wait so a stopped clock is noticed promptly
+                    timeout = 0.1
+                    if self._heap:
+                        timeout = min(timeout, self._heap[0][0] - now)
+                    self._cond.wait(timeout)
+                    continue
+
+            for task in due:
+                self._pool.submit(self._advance, task)
+
+        self._finish()
+
+    def _advance(self, task):
+        """Run a visitor until its next sleep, then put it back on the heap"""
+        try:
+            wait = next(task)
+        except StopIteration:
+            return
+        except Exception as e:
+            print(f"[VISITORS] Visitor task stopped with error: {e!r}")
+            return
+        
+        if isinstance(wait, ServedEvent):
+            resume = lambda: self._push(time.monotonic(), task)
+            if not wait.park_until_set(resume):
+                resume()
+            return
+        self._push(time.monotonic() + self.clock.real_seconds(wait), task)
+
+    def _finish(self):
+        """
+        Give every sleeping visitor one more step so it can notice the
+        clock has stopped and record its exit, then drop the rest.
+        Visitors still parked in a queue are left where they are.
+        """
+        self._pool.shutdown(wait=True)
+        with self._cond:
+            pending = [entry[2] for entry in self._heap]
+            self._heap = []
+
+        for task in pending:
+            try:
+                next(task)
+            except StopIteration:
+                continue
+            except Exception as e:
+                print(f"[VISITORS] Visitor task stopped with error: {e!r}")
+                continue
+            task.close()
@@ -1,11 +1,73 @@
 from PIL import Image, ImageDraw, ImageFont
+import sys
+import os
 import matplotlib
-matplotlib.use('TkAgg')  
 import matplotlib.pyplot as plt
+
+def _select_backend():
+    """
+    Pick the GUI backend: PARK_MPL_BACKEND if set, TkAgg on macOS (the UI
+    must own the main thread there), otherwise the first of Qt, GTK and Tk
+    that loads. Qt and GTK blit several times faster than Tk.
+    """
+    backend = os.environ.get("PARK_MPL_BACKEND")
+    if backend:
+        matplotlib.use(backend)
+        return
+    if sys.platform != "darwin":
+        for backend in ("QtAgg", "GTK3Agg"):
+            # Switching through pyplot actually imports the backend (and its
+            # GUI bindings), so a missing toolkit fails here and not later
+            try:
+                plt.switch_backend(backend)
+                return
+            except (ImportError, ValueError):
+                continue
+    matplotlib.use('TkAgg', force=False)
+
+_select_backend()
 from matplotlib.widgets import Button
+from matplotlib.animation import FuncAnimation
+import numpy as np
 import threading
-import sys
-import os
+import queue
+
+# Seconds between display updates (and between frame builds)
+FRAME_INTERVAL = 0.2
+
+# Seconds between frame builds while nothing but the clock is changing
+# (e.g. before the first visitors arrive), and how many simulated minutes
+# before closing time the view goes back to the fast rate
+IDLE_FRAME_INTERVAL = 2.0
+CLOSING_MINUTES = 10
+
+# Light green park background
+BACKGROUND_RGB = (144, 238, 144)
+
+# Capacity bar (vertical, on the left) and statistics panel geometry
+BAR_X, BAR_Y, BAR_WIDTH, BAR_HEIGHT = 20, 100, 40, 400
+PANEL_X, PANEL_Y, PANEL_WIDTH, PANEL_HEIGHT = 850, 580, 520, 200
+
+# Ride fill colours by state name; any other state (OPEN, BROKEN) shows green
+RIDE_STATE_COLORS = {
+    "MAINTENANCE": (255, 0, 0, 220),  # Red
+    "BOARDING": (50, 150, 200, 200),  # Blue
+}
+RIDE_DEFAULT_COLOR = (50, 200, 50, 200)  # Green
+
+# Capacity bar colours from green (empty) to red (full), indexed by int(percent * 2.55)
+CAPACITY_COLORS = tuple((k, 255 - k, 0, 255) for k in range(256))
+
+# Font sizes used by the live view
+FONT_SIZES = (9, 10, 11, 13, 14, 16, 32, 48)
+
+def _load_fonts():
+    """Load every font size once (PIL's default font if Arial is missing)"""
+    try:
+        return {size: ImageFont.truetype("arial.ttf", size) for size in FONT_SIZES}
+    except OSError:
+        default = ImageFont.load_default()
+        return dict.fromkeys(FONT_SIZES, default)
 
 class ParkUI:
     """
@@ -26,6 +88,33 @@ class ParkUI:
         # Park configuration
         self.max_capacity = 1000  # Adjust as needed
         
+        # Fonts by point size, loaded from disk once
+        self._fonts = _load_fonts()
+        
+        # Persistent plot artists, created by _run_ui and _init_plot
+        self._fig = None
+        self._ax_main = None
+        self._im = None
+        self._ax_button = None
+        self._btn_close = None
+        self._anim = None
+        self._finished = False  # Set once the final screen is up
+        self._ride_positions = None
+        self._facility_positions = None
+        
+        # Frame being drawn: shapes go straight into the pixel array, text
+        # is queued and drawn with PIL once the shapes are done
+        self._fb = None
+        self._texts = []
+        self._static_bg = None  # Title, headings and frames, drawn once
+        self._last_signature = None  # What the latest frame was drawn from
+        
+        # Frames are built on a worker thread and handed to the GUI thread,
+        # newest last; the worker drops the oldest rather than fall behind
+        self._frames = queue.Queue(maxsize=2)
+        self._producer = None
+        self._producer_stop = threading.Event()
+        
     def start(self):
         """Start the UI on the MAIN thread (required for macOS)"""
         self.running = True
@@ -34,19 +123,21 @@ class ParkUI:
     def stop(self):
         """Stop the UI"""
         self.running = False
+        self._producer_stop.set()
         plt.close('all')
         
     def _run_ui(self):
-        """Main UI loop - must run on main thread"""
+        """Set up the window and run the live view - must run on main thread"""
         # Create base image (800x600 for the park map)
         width, height = 1400, 800
         
         # Define positions for park elements
-        ride_positions = self._calculate_ride_positions()
-        facility_positions = self._calculate_facility_positions()
+        self._ride_positions = self._calculate_ride_positions()
+        self._facility_positions = self._calculate_facility_positions()
         
         plt.ion()  # Turn on interactive mode
         fig = plt.figure(figsize=(14, 8))
+        self._init_plot(fig, width, height)
         
         # Add window close event handler
         def on_window_close(event):
@@ -122,127 +213,237 @@ class ParkUI:
             os._exit(0)
         
         btn_exit.on_clicked(on_exit_click)
+        self._ax_button = ax_button
         
         try:
-            while self.running:
+            # Build frames off the GUI thread; the GUI thread only displays them
+            self._producer = threading.Thread(target=self._produce_frames, daemon=True)
+            self._producer.start()
+            
+            # Matplotlib schedules the updates and blits what _update returns
+            self._anim = FuncAnimation(fig, self._update, interval=int(FRAME_INTERVAL * 1000),
+                                       blit=True, cache_frame_data=False)
+            plt.show(block=True)  # Block until the window is closed
+        except Exception as e:
+            print(f"UI Error: {e}")
+            import traceback
+            traceback.print_exc()
+        finally:
+            print("UI shutting down...")
+            self._producer_stop.set()
+            plt.close('all')
+    
+    def _init_plot(self, fig, width, height):
+        """Create the park image artist once; later ticks only replace its pixels"""
+        self._fig = fig
+        self._ax_main = fig.add_axes([0.05, 0.1, 0.9, 0.85])  # [left, bottom, width, height]
+        # Animated, so full redraws leave it out of the saved blit background
+        self._im = self._ax_main.imshow(np.zeros((height, width, 3), dtype=np.uint8), animated=True)
+        self._ax_main.axis('off')
+        self._build_static_background(width, height)
+    
+    def _is_over(self, current_time):
+        """Check if simulation time is complete (check earlier, at 479 to be safe)"""
+        return current_time >= 479 or self.clock.should_stop()
+    
+    def _produce_frames(self):
+        """Worker thread: build a new frame whenever what the view shows changes"""
+        try:
+            while self.running and not self._producer_stop.is_set():
                 current_time = self.clock.now()
+                if self._is_over(current_time):
+                    break  # The GUI thread draws the final screen itself
                 
-                # Check if simulation time is complete (check earlier, at 479 to be safe)
-                if current_time >= 479 or self.clock.should_stop():
-                    print(f"\nSimulation approaching end at minute {current_time}...")
-                    
-                    # Draw final state
-                    park_image = Image.new('RGB', (width, height), color='#90EE90')
-                    draw = ImageDraw.Draw(park_image, 'RGBA')
-                    
-                    try:
-                        self._draw_title(draw)
-                        self._draw_capacity_bar(draw)
-                        self._draw_rides(draw, ride_positions)
-                        self._draw_facilities(draw, facility_positions)
-                        self._draw_metrics(draw)
-                    except Exception as draw_error:
-                        print(f"Error drawing final state: {draw_error}")
-                    
-                    # Add "SIMULATION COMPLETE" message
-                    try:
-                        from PIL import ImageFont
-                        font = ImageFont.truetype("arial.ttf", 48)
-                    except:
-                        font = None
-                    
-                    # Semi-transparent overlay
-                    overlay = Image.new('RGBA', (width, height), (0, 0, 0, 150))
-                    draw_overlay = ImageDraw.Draw(overlay)
-                    if font:
-                        draw_overlay.text((400, 350), "SIMULATION COMPLETE", fill=(255, 255, 255, 255), font=font)
-                    else:
-                        draw_overlay.text((500, 350), "SIMULATION COMPLETE", fill=(255, 255, 255, 255))
-                    
-                    park_image = Image.alpha_composite(park_image.convert('RGBA'), overlay)
-                    
-                    # Display final state
-                    plt.clf()
-                    
-                    # Draw the final park image
-                    ax_main = plt.axes([0.05, 0.15, 0.9, 0.8])
-                    ax_main.imshow(park_image)
-                    ax_main.axis('off')
-                    
-                    # Re-add the close button for final screen
-                    ax_button_final = plt.axes([0.4, 0.05, 0.2, 0.05])
-                    btn_close = Button(ax_button_final, 'Close Window', color='#4CAF50', hovercolor='#45a049')
-                    
-                    def on_close_click(event):
-                        print("\nClosing simulation window...")
-                        self.running = False
-                        plt.close('all')
+                # Only redraw when something on screen has changed
+                signature = self._state_signature(current_time)
+                previous = self._last_signature
+                if signature != previous:
+                    self._last_signature = signature
                     
-                    btn_close.on_clicked(on_close_click)
-                    
-                    plt.draw()
-                    
-                    print(f"Simulation ended at minute {current_time}")
-                    print("Click 'Close Window' button or close the window to continue...")
-                    
-                    # Keep window open until button is clicked or window is closed
-                    try:
-                        plt.show(block=True)  # Block until window is closed
-                    except:
-                        pass
-                    
-                    self.running = False
-                    break
-                    
-                # Create new image
-                park_image = Image.new('RGB', (width, height), color='#90EE90')  # Light green background
-                draw = ImageDraw.Draw(park_image, 'RGBA')
-                
-                # Draw title
-                self._draw_title(draw)
-                
-                # Draw park capacity bar
-                self._draw_capacity_bar(draw)
-                
-                # Draw rides
-                self._draw_rides(draw, ride_positions)
-                
-                # Draw facilities (food, merch, bathrooms)
-                self._draw_facilities(draw, facility_positions)
-                
-                # Draw metrics summary
-                self._draw_metrics(draw)
-                
-                # Display the image
-                plt.clf()
-                
-                # Draw the park image
-                ax_main = plt.axes([0.05, 0.1, 0.9, 0.85])  # [left, bottom, width, height]
-                ax_main.imshow(park_image)
-                ax_main.axis('off')
+                    # Draw the title, capacity bar, rides, facilities and metrics
+                    # (the summary is only worth fetching for a frame that is drawn)
+                    summary = self.metrics.get_summary()
+                    park_image = self._render_frame(self._ride_positions, self._facility_positions, summary)
+                    self._push_frame(np.asarray(park_image))
                 
-                # Add the exit button
-                ax_button = plt.axes([0.85, 0.02, 0.12, 0.04])
-                btn_exit = Button(ax_button, 'Exit Simulation', color='#ff6b6b', hovercolor='#ff5252')
-                btn_exit.on_clicked(on_exit_click)
-                
-                plt.draw()
-                
-                # Use non-blocking pause with timeout - faster updates
+                # Back off while only the clock moves, but never near closing time
+                idle = previous is not None and signature[1:] == previous[1:]
+                if idle and current_time < 479 - CLOSING_MINUTES:
+                    self._producer_stop.wait(IDLE_FRAME_INTERVAL)
+                else:
+                    self._producer_stop.wait(FRAME_INTERVAL)
+        except Exception as e:
+            print(f"UI Error: {e}")
+            import traceback
+            traceback.print_exc()
+            self.running = False  # The GUI thread closes the window on its next tick
+    
+    def _push_frame(self, frame):
+        """Queue a finished frame, dropping the oldest waiting one if full"""
+        try:
+            self._frames.put_nowait(frame)
+        except queue.Full:
+            try:
+                self._frames.get_nowait()
+            except queue.Empty:
+                pass  # The GUI thread just took it
+            self._frames.put_nowait(frame)  # Only this thread puts, so there is room now
+    
+    def _update(self, frame):
+        """Animation step (GUI thread): show the newest finished frame, if any"""
+        if self._finished:
+            return ()
+        if not self.running:
+            # The frame worker stopped; close the view as stop() would
+            self._finished = True
+            plt.close('all')
+            return ()
+        
+        try:
+            current_time = self.clock.now()
+            if self._is_over(current_time):
+                # Nothing to blit: the final screen comes from a full redraw
+                self._show_final_state(current_time)
+                return ()
+            
+            latest = None
+            while True:
                 try:
-                    plt.pause(0.2)  # Update every 0.2 seconds (5 times per second)
-                except:
-                    # If window is closed, stop gracefully
-                    self.running = False
+                    latest = self._frames.get_nowait()
+                except queue.Empty:
                     break
-                
+            if latest is not None:
+                self._im.set_data(latest)
         except Exception as e:
             print(f"UI Error: {e}")
             import traceback
             traceback.print_exc()
-        finally:
-            print("UI shutting down...")
+            self._finished = True
+            self._anim.pause()
+            self._im.set_animated(False)
+            return ()
+        
+        return (self._im,)
+    
+    def _show_final_state(self, current_time):
+        """Stop animating and show the final park state with a Close button"""
+        print(f"\nSimulation approaching end at minute {current_time}...")
+        self._finished = True
+        self._anim.pause()
+        # Full redraws skip animated artists, so the final image must not be one
+        self._im.set_animated(False)
+        
+        # The worker shares the framebuffer and text list, so wait until it
+        # has really exited; it checks the stop flag after every frame
+        self._producer_stop.set()
+        if self._producer is not None:
+            self._producer.join()
+        width, height = self._fb.shape[1], self._fb.shape[0]
+        
+        # Draw final state
+        try:
+            park_image = self._render_frame(self._ride_positions, self._facility_positions,
+                                            self.metrics.get_summary())
+        except Exception as draw_error:
+            print(f"Error drawing final state: {draw_error}")
+            park_image = Image.new('RGB', (width, height), color=BACKGROUND_RGB)
+        
+        # Darken it as a black overlay at alpha 150 would: keep 105/255 of each channel
+        dimmed = np.asarray(park_image, dtype=np.uint16) * 105 // 255
+        park_image = Image.fromarray(dimmed.astype(np.uint8))
+        
+        # Add "SIMULATION COMPLETE" message
+        draw = ImageDraw.Draw(park_image)
+        draw.text((400, 350), "SIMULATION COMPLETE", fill=(255, 255, 255), font=self._fonts[48])
+        
+        # Display the final image, moved up to make room for the close button
+        self._ax_main.set_position([0.05, 0.15, 0.9, 0.8])
+        self._im.set_data(np.asarray(park_image))
+        
+        # Swap the exit button for a close button
+        self._ax_button.remove()
+        ax_button_final = self._fig.add_axes([0.4, 0.05, 0.2, 0.05])
+        self._btn_close = Button(ax_button_final, 'Close Window', color='#4CAF50', hovercolor='#45a049')
+        
+        def on_close_click(event):
+            print("\nClosing simulation window...")
+            self.running = False
             plt.close('all')
+        
+        self._btn_close.on_clicked(on_close_click)
+        self._fig.canvas.draw_idle()
+        
+        print(f"Simulation ended at minute {current_time}")
+        print("Click 'Close Window' button or close the window to continue...")
+    
+    def _state_signature(self, current_time):
+        """
+        Cheap fingerprint of the state the view shows. The clock minute is
+        part of it, so the metrics panel still refreshes at least once per
+        simulated minute.
+        """
+        return (
+            current_time,
+            self.park.get_total_visitors(),
+            tuple((ride.get_state_name(), ride.queue.size(), ride.get_total_riders(),
+                   ride.get_state_time_remaining()) for ride in self.rides),
+            tuple(truck.queue.size() for truck in self.food_trucks),
+            tuple(stand.queue.size() for stand in self.merch_stands),
+            tuple(bathroom.queue.size() for bathroom in self.bathrooms),
+        )
+    
+    def _build_static_background(self, width, height):
+        """Render the parts of the view that never change, once"""
+        self._fb = np.empty((height, width, 3), dtype=np.uint8)
+        self._fb[:] = BACKGROUND_RGB
+        self._texts.clear()
+        self._draw_static_background()
+        self._static_bg = np.asarray(self._draw_queued_text())
+    
+    def _render_frame(self, ride_positions, facility_positions, summary):
+        """Draw the whole park view and return it as a PIL image"""
+        self._fb[:] = self._static_bg
+        self._texts.clear()
+        
+        self._draw_title()
+        self._draw_capacity_bar()
+        self._draw_rides(ride_positions)
+        self._draw_facilities(facility_positions)
+        self._draw_metrics(summary)
+        
+        return self._draw_queued_text()
+    
+    def _draw_queued_text(self):
+        """Draw the queued text over the framebuffer's shapes (the only PIL drawing left)"""
+        park_image = Image.fromarray(self._fb)
+        draw = ImageDraw.Draw(park_image)
+        for xy, text, fill, font in self._texts:
+            draw.text(xy, text, fill=fill, font=font)
+        return park_image
+    
+    def _rect(self, x1, y1, x2, y2, fill, outline_width=0):
+        """
+        Fill the rectangle with corners (x1, y1) and (x2, y2), inclusive,
+        blending translucent RGBA fills over what is already there as
+        ImageDraw does. Optionally add a black outline inside the edge.
+        """
+        region = self._fb[y1:y2 + 1, x1:x2 + 1]
+        alpha = fill[3] if len(fill) == 4 else 255
+        if alpha == 255:
+            region[:] = fill[:3]
+        else:
+            blended = region * np.uint16(255 - alpha) + np.array(fill[:3], dtype=np.uint16) * alpha
+            region[:] = blended // 255
+        if outline_width:
+            w = outline_width
+            region[:w] = 0
+            region[-w:] = 0
+            region[:, :w] = 0
+            region[:, -w:] = 0
+    
+    def _text(self, xy, text, fill, font):
+        """Queue text to draw on top once all shapes are in place"""
+        self._texts.append((xy, text, fill, font))
     
     def _calculate_ride_positions(self):
         """Calculate positions for rides on the map"""
@@ -301,71 +502,56 @@ class ParkUI:
         
         return positions
     
-    def _draw_title(self, draw):
-        """Draw the park title"""
-        try:
-            font = ImageFont.truetype("arial.ttf", 32)
-        except:
-            font = ImageFont.load_default()
-        
-        draw.text((500, 20), "🎢 AMUSEMENT PARK LIVE VIEW 🎡", fill="black", font=font)
-        
-        # Current time
-        try:
-            small_font = ImageFont.truetype("arial.ttf", 16)
-        except:
-            small_font = ImageFont.load_default()
+    def _draw_static_background(self):
+        """
+        Draw everything that never changes: the title, the capacity bar
+        frame, the facility headings and the statistics panel.
+        """
+        self._text((500, 20), "🎢 AMUSEMENT PARK LIVE VIEW 🎡", "black", self._fonts[32])
+        
+        # Capacity bar label and empty bar
+        self._text((BAR_X - 5, BAR_Y - 30), "Park Capacity", "black", self._fonts[14])
+        self._rect(BAR_X, BAR_Y, BAR_X + BAR_WIDTH, BAR_Y + BAR_HEIGHT, (128, 128, 128))
+        
+        # Facility headings
+        font = self._fonts[10]
+        self._text((1050, 75), "Food Trucks:", "black", font)
+        self._text((1050, 375), "Merch Stands:", "black", font)
+        self._text((50, 625), "Bathrooms:", "black", font)
         
+        # Metrics panel - made larger to fit new stats
+        self._rect(PANEL_X - 10, PANEL_Y - 10, PANEL_X + PANEL_WIDTH, PANEL_Y + PANEL_HEIGHT,
+                   (255, 255, 220, 230), outline_width=2)
+        self._text((PANEL_X + 150, PANEL_Y), "📊 PARK STATISTICS", "black", self._fonts[13])
+    
+    def _draw_title(self):
+        """Draw the current time under the title"""
         current_minute = self.clock.now()
-        draw.text((550, 60), f"Time: {current_minute} minutes", fill="black", font=small_font)
+        self._text((550, 60), f"Time: {current_minute} minutes", "black", self._fonts[16])
     
-    def _draw_capacity_bar(self, draw):
-        """Draw park capacity progress bar"""
+    def _draw_capacity_bar(self):
+        """Fill the park capacity bar"""
         total_visitors = self.park.get_total_visitors()
         capacity_percentage = min(100, (total_visitors / self.max_capacity) * 100)
+        bar_fill_height = int((capacity_percentage / 100) * BAR_HEIGHT)
         
-        # Vertical bar on the left
-        bar_x = 20
-        bar_y_start = 100
-        bar_height = 400
-        bar_width = 40
-        bar_fill_height = int((capacity_percentage / 100) * bar_height)
-        
-        try:
-            font = ImageFont.truetype("arial.ttf", 14)
-        except:
-            font = ImageFont.load_default()
-        
-        draw.text((bar_x - 5, bar_y_start - 30), "Park Capacity", fill="black", font=font)
-        
-        # Background
-        draw.rectangle(
-            [bar_x, bar_y_start, bar_x + bar_width, bar_y_start + bar_height],
-            fill="gray"
-        )
+        font = self._fonts[14]
         
         # Filled part with color gradient
-        color = self._value_to_color(capacity_percentage)
-        draw.rectangle(
-            [bar_x, bar_y_start + bar_height - bar_fill_height, 
-             bar_x + bar_width, bar_y_start + bar_height],
-            fill=color
-        )
+        color = CAPACITY_COLORS[int(capacity_percentage * 2.55)]
+        self._rect(BAR_X, BAR_Y + BAR_HEIGHT - bar_fill_height,
+                   BAR_X + BAR_WIDTH, BAR_Y + BAR_HEIGHT, color)
         
         # Percentage label
-        draw.text((bar_x + 5, bar_y_start + bar_height + 10), 
-                 f"{int(capacity_percentage)}%", fill="black", font=font)
-        draw.text((bar_x - 10, bar_y_start + bar_height + 30), 
-                 f"{total_visitors}/{self.max_capacity}", fill="black", font=font)
+        self._text((BAR_X + 5, BAR_Y + BAR_HEIGHT + 10),
+                   f"{int(capacity_percentage)}%", "black", font)
+        self._text((BAR_X - 10, BAR_Y + BAR_HEIGHT + 30),
+                   f"{total_visitors}/{self.max_capacity}", "black", font)
     
-    def _draw_rides(self, draw, positions):
+    def _draw_rides(self, positions):
         """Draw all rides with their status"""
-        try:
-            font = ImageFont.truetype("arial.ttf", 11)
-            small_font = ImageFont.truetype("arial.ttf", 9)
-        except:
-            font = ImageFont.load_default()
-            small_font = ImageFont.load_default()
+        font = self._fonts[11]
+        small_font = self._fonts[9]
         
         for ride in self.rides:
             if ride.name not in positions:
@@ -381,14 +567,8 @@ class ParkUI:
             total_riders = ride.get_total_riders()
             time_remaining = ride.get_state_time_remaining()
             
-            # Determine color based on state (case-insensitive comparison)
-            state_upper = state.upper()
-            if state_upper == "MAINTENANCE":
-                color = (255, 0, 0, 220)  # RED for maintenance
-            elif state_upper == "BOARDING":
-                color = (50, 150, 200, 200)  # Blue
-            else:  # OPEN, BROKEN, or any other state - all shown as green
-                color = (50, 200, 50, 200)  # Green
+            # Determine color based on state (state names are upper case)
+            color = RIDE_STATE_COLORS.get(state, RIDE_DEFAULT_COLOR)
             
             # Draw ride rectangle
             x1 = center_x - width // 2
@@ -396,37 +576,31 @@ class ParkUI:
             x2 = center_x + width // 2
             y2 = center_y + height // 2
             
-            draw.rectangle([x1, y1, x2, y2], fill=color, outline="black", width=2)
+            self._rect(x1, y1, x2, y2, color, outline_width=2)
             
             # Draw ride name
             # Truncate long names
             display_name = ride.name[:12] if len(ride.name) > 12 else ride.name
-            draw.text((center_x - 50, center_y - 35), display_name, fill="white", font=font)
+            self._text((center_x - 50, center_y - 35), display_name, "white", font)
             
             # Draw state with time remaining if applicable
-            if time_remaining > 0 and state_upper in ["MAINTENANCE", "BROKEN"]:
+            if time_remaining > 0 and state in ("MAINTENANCE", "BROKEN"):
                 state_text = f"{state} ({time_remaining}m)"
-                draw.text((center_x - 50, center_y - 15), state_text, fill="white", font=small_font)
+                self._text((center_x - 50, center_y - 15), state_text, "white", small_font)
             else:
-                draw.text((center_x - 40, center_y - 15), state, fill="white", font=small_font)
+                self._text((center_x - 40, center_y - 15), state, "white", small_font)
             
             # Draw queue size
-            draw.text((center_x - 40, center_y + 5), f"Queue: {queue_size}", 
-                     fill="white", font=small_font)
+            self._text((center_x - 40, center_y + 5), f"Queue: {queue_size}", "white", small_font)
             
             # Draw total riders
-            draw.text((center_x - 40, center_y + 20), f"Riders: {total_riders}", 
-                     fill="white", font=small_font)
+            self._text((center_x - 40, center_y + 20), f"Riders: {total_riders}", "white", small_font)
     
-    def _draw_facilities(self, draw, positions):
+    def _draw_facilities(self, positions):
         """Draw food trucks, merch stands, and bathrooms"""
-        try:
-            font = ImageFont.truetype("arial.ttf", 10)
-        except:
-            font = ImageFont.load_default()
+        font = self._fonts[10]
         
         # Draw food trucks
-        draw.text((1050, 75), "Food Trucks:", fill="black", font=font)
         for i, truck in enumerate(self.food_trucks):
             pos_data = positions['food'][i]
             x, y = pos_data['pos']
@@ -436,12 +610,10 @@ class ParkUI:
             is_busy = queue_size > 0
             color = (255, 100, 100, 180) if is_busy else (100, 255, 100, 180)
             
-            draw.rectangle([x, y, x + w, y + h], fill=color, outline="black", width=1)
-            draw.text((x + w + 5, y), f"{truck.name} ({queue_size})", 
-                     fill="black", font=font)
+            self._rect(x, y, x + w, y + h, color, outline_width=1)
+            self._text((x + w + 5, y), f"{truck.name} ({queue_size})", "black", font)
         
         # Draw merch stands
-        draw.text((1050, 375), "Merch Stands:", fill="black", font=font)
         for i, stand in enumerate(self.merch_stands):
             pos_data = positions['merch'][i]
             x, y = pos_data['pos']
@@ -451,12 +623,10 @@ class ParkUI:
             is_busy = queue_size > 0
             color = (255, 100, 255, 180) if is_busy else (200, 150, 255, 180)
             
-            draw.rectangle([x, y, x + w, y + h], fill=color, outline="black", width=1)
-            draw.text((x + w + 5, y), f"{stand.name} ({queue_size})", 
-                     fill="black", font=font)
+            self._rect(x, y, x + w, y + h, color, outline_width=1)
+            self._text((x + w + 5, y), f"{stand.name} ({queue_size})", "black", font)
         
         # Draw bathrooms
-        draw.text((50, 625), "Bathrooms:", fill="black", font=font)
         for i, bathroom in enumerate(self.bathrooms):
             pos_data = positions['bathrooms'][i]
             x, y = pos_data['pos']
@@ -466,29 +636,13 @@ class ParkUI:
             is_occupied = bathroom.queue.size() > 0
             color = (150, 150, 200, 180) if is_occupied else (200, 200, 255, 180)
             
-            draw.rectangle([x, y, x + w, y + h], fill=color, outline="black", width=1)
+            self._rect(x, y, x + w, y + h, color, outline_width=1)
     
-    def _draw_metrics(self, draw):
-        """Draw summary metrics with new updates"""
-        try:
-            font = ImageFont.truetype("arial.ttf", 13)
-            small_font = ImageFont.truetype("arial.ttf", 11)
-        except:
-            font = ImageFont.load_default()
-            small_font = ImageFont.load_default()
-        
-        summary = self.metrics.get_summary()
-        
-        # Metrics panel - made larger to fit new stats
-        panel_x = 850
-        panel_y = 580
-        panel_width = 520
-        panel_height = 200
-        
-        draw.rectangle([panel_x - 10, panel_y - 10, panel_x + panel_width, panel_y + panel_height], 
-                      fill=(255, 255, 220, 230), outline="black", width=2)
-        
-        draw.text((panel_x + 150, panel_y), "📊 PARK STATISTICS", fill="black", font=font)
+    def _draw_metrics(self, summary):
+        """Fill in the summary metrics panel from a Metrics.get_summary() result"""
+        font = self._fonts[13]
+        small_font = self._fonts[11]
+        panel_x, panel_y = PANEL_X, PANEL_Y
         
         # Left column
         metrics_left = [
@@ -501,7 +655,7 @@ class ParkUI:
         
         y_offset = 25
         for text in metrics_left:
-            draw.text((panel_x, panel_y + y_offset), text, fill="black", font=small_font)
+            self._text((panel_x, panel_y + y_offset), text, "black", small_font)
             y_offset += 22
         
         # Right column - new operational metrics
@@ -515,21 +669,11 @@ class ParkUI:
         
         y_offset = 25
         for text in metrics_right:
-            draw.text((panel_x + 260, panel_y + y_offset), text, fill="black", font=small_font)
+            self._text((panel_x + 260, panel_y + y_offset), text, "black", small_font)
             y_offset += 22
         
         # Most popular ride at bottom
-        if summary['ride_counts']:
-            most_popular = max(summary['ride_counts'].items(), key=lambda x: x[1])
-            draw.text((panel_x, panel_y + 140), 
-                     f"🎢 Most Popular: {most_popular[0]} ({most_popular[1]} rides)", 
-                     fill="blue", font=font)
-    
-    def _value_to_color(self, value, min_value=0, max_value=100):
-        """Convert value to RGB color (green to red gradient)"""
-        value = max(min_value, min(max_value, value))
-        ratio = (value - min_value) / (max_value - min_value)
-        r = int(255 * ratio)
-        g = int(255 * (1 - ratio))
-        b = 0
-        return (r, g, b, 255)
+        most_popular = summary['most_popular']
+        if most_popular:
+            self._text((panel_x, panel_y + 140),
+                       f"🎢 Most Popular: {most_popular[0]} ({most_popular[1]} rides)", "blue", font)
@@ -4,205 +4,302 @@ View Metrics Database
 Query and display metrics from the SQLite database
 """
 
+import io
 import sqlite3
 import sys
 
-def view_all_tables(db_path="park_metrics.sqlite"):
-    """View all tables and their row counts"""
+# Every single-value total view_summary_stats reports, fetched as one row
+SCALAR_STATS_QUERY = """
+    SELECT
+        (SELECT COUNT(*) FROM visitor_arrivals),
+        (SELECT COUNT(*) FROM visitor_exits),
+        (SELECT COALESCE(SUM(amount), 0) FROM food_purchases),
+        (SELECT COALESCE(SUM(amount), 0) FROM merch_purchases),
+        (SELECT COUNT(*) FROM social_groups),
+        (SELECT COUNT(*) FROM staff_actions),
+        (SELECT COUNT(*) FROM ride_breakdowns),
+        (SELECT COUNT(*) FROM ride_maintenance),
+        (SELECT COUNT(*) FROM cleanliness_logs)
+"""
+
+# Rows fetched and written at a time by view_table_sample
+SAMPLE_BATCH = 64
+
+# Indexes behind view_summary_stats' GROUP BY queries (covering where the
+# query also aggregates a column)
+SUMMARY_INDEXES = """
+    CREATE INDEX IF NOT EXISTS idx_visitor_arrivals_type ON visitor_arrivals(type);
+    CREATE INDEX IF NOT EXISTS idx_rides_ride_name ON rides(ride_name);
+    CREATE INDEX IF NOT EXISTS idx_social_groups_type ON social_groups(group_type, group_size);
+    CREATE INDEX IF NOT EXISTS idx_staff_actions_type ON staff_actions(action_type);
+    CREATE INDEX IF NOT EXISTS idx_cleanliness_logs_zone ON cleanliness_logs(zone, cleanliness_level);
+"""
+
+def _prepare_for_reads(conn, create_indexes=False):
+    """
+    Set a connection up for reporting: optionally add the summary indexes,
+    then use a larger page cache, memory-mapped reads and refuse writes.
+    """
+    if create_indexes:
+        try:
+            conn.executescript(SUMMARY_INDEXES)
+        except sqlite3.OperationalError as e:
+            # E.g. a read-only file; the queries still work without them
+            print(f"Could not create summary indexes: {e}")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    conn.execute("PRAGMA query_only=1")
+
+def _open_for_reads(db_path, create_indexes=False):
+    """Open db_path in WAL mode and set it up for reporting"""
+    conn = sqlite3.connect(db_path)
+    try:
+        # Lets reports run while the simulation is still writing
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    except sqlite3.OperationalError:
+        pass  # Read-only file; keep its journal mode
+    _prepare_for_reads(conn, create_indexes)
+    return conn
+
+def _flush(out):
+    """Write buffered report text to stdout in one call and empty the buffer"""
+    sys.stdout.write(out.getvalue())
+    out.seek(0)
+    out.truncate()
+
+def view_all_tables(db_path="park_metrics.sqlite", conn=None):
+    """View all tables and their row counts (on conn if given)"""
+    own_conn = conn is None
+    out = io.StringIO()  # Report text, written to stdout in one go
     try:
-        conn = sqlite3.connect(db_path)
+        if own_conn:
+            conn = _open_for_reads(db_path)
         cur = conn.cursor()
         
         # Get all table names
         cur.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
         tables = cur.fetchall()
         
-        print("\n" + "="*60)
-        print("PARK METRICS DATABASE SUMMARY")
-        print("="*60)
-        print(f"Database: {db_path}\n")
+        print("\n" + "="*60, file=out)
+        print("PARK METRICS DATABASE SUMMARY", file=out)
+        print("="*60, file=out)
+        print(f"Database: {db_path}\n", file=out)
         
         for (table_name,) in tables:
             cur.execute(f"SELECT COUNT(*) FROM {table_name}")
             count = cur.fetchone()[0]
-            print(f"  {table_name:30} {count:6} rows")
-        
-        conn.close()
+            print(f"  {table_name:30} {count:6} rows", file=out)
         
     except sqlite3.Error as e:
-        print(f"Database error: {e}")
+        print(f"Database error: {e}", file=out)
     except Exception as e:
-        print(f"Error: {e}")
+        print(f"Error: {e}", file=out)
+    finally:
+        _flush(out)
+        if own_conn and conn is not None:
+            conn.close()
 
-def view_table_sample(db_path="park_metrics.sqlite", table_name=None, limit=10):
-    """View sample data from a specific table"""
+def view_table_sample(db_path="park_metrics.sqlite", table_name=None, limit=10, conn=None):
+    """View sample data from a specific table (on conn if given)"""
+    own_conn = conn is None
+    out = io.StringIO()  # Report text, written to stdout in one go
     try:
-        conn = sqlite3.connect(db_path)
+        if own_conn:
+            conn = _open_for_reads(db_path)
         cur = conn.cursor()
         
+        cur.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
+        tables = [name for (name,) in cur.fetchall()]
+        
         if table_name is None:
-            print("Available tables:")
-            cur.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
-            for (name,) in cur.fetchall():
-                print(f"  - {name}")
-            conn.close()
+            print("Available tables:", file=out)
+            for name in tables:
+                print(f"  - {name}", file=out)
             return
         
+        # Table names can't be bound parameters, so only accept real ones
+        if table_name not in tables:
+            raise ValueError(f"Unknown table: {table_name}")
+        
         # Get column names
         cur.execute(f"PRAGMA table_info({table_name})")
         columns = [row[1] for row in cur.fetchall()]
+        # One format call per row instead of one f-string per cell
+        row_format = " | ".join(["{!s:15}"] * len(columns))
         
-        # Get sample data
-        cur.execute(f"SELECT * FROM {table_name} LIMIT {limit}")
-        rows = cur.fetchall()
+        # Get sample data, a batch at a time
+        cur.execute(f"SELECT * FROM {table_name} LIMIT ?", (limit,))
+        batch = cur.fetchmany(SAMPLE_BATCH)
         
-        print(f"\n{'='*60}")
-        print(f"Table: {table_name} (showing {len(rows)} of {limit} max)")
-        print('='*60)
+        print(f"\n{'='*60}", file=out)
+        print(f"Table: {table_name} (showing up to {limit} rows)", file=out)
+        print('='*60, file=out)
         
-        if rows:
+        if batch:
             # Print header
-            print(" | ".join(f"{col:15}" for col in columns))
-            print("-" * (len(columns) * 18))
+            print(row_format.format(*columns), file=out)
+            print("-" * (len(columns) * 18), file=out)
             
-            # Print rows
-            for row in rows:
-                print(" | ".join(f"{str(val):15}" for val in row))
+            # Print rows, one write per batch
+            shown = 0
+            while batch:
+                out.write("\n".join(row_format.format(*row) for row in batch) + "\n")
+                _flush(out)
+                shown += len(batch)
+                batch = cur.fetchmany(SAMPLE_BATCH)
+            print(f"({shown} rows)", file=out)
         else:
-            print("No data in table")
-        
-        conn.close()
+            print("No data in table", file=out)
         
     except sqlite3.Error as e:
-        print(f"Database error: {e}")
+        print(f"Database error: {e}", file=out)
     except Exception as e:
-        print(f"Error: {e}")
+        print(f"Error: {e}", file=out)
+    finally:
+        _flush(out)
+        if own_conn and conn is not None:
+            conn.close()
 
-def view_summary_stats(db_path="park_metrics.sqlite"):
-    """View summary statistics"""
+def view_summary_stats(db_path="park_metrics.sqlite", conn=None):
+    """
+    View summary statistics (on conn if given; a shared connection should
+    come from _open_for_reads(..., create_indexes=True))
+    """
+    own_conn = conn is None
+    out = io.StringIO()  # Report text, written to stdout in one go
     try:
-        conn = sqlite3.connect(db_path)
+        if own_conn:
+            conn = _open_for_reads(db_path, create_indexes=True)
         cur = conn.cursor()
         
-        print("\n" + "="*60)
-        print("DETAILED STATISTICS")
-        print("="*60)
+        print("\n" + "="*60, file=out)
+        print("DETAILED STATISTICS", file=out)
+        print("="*60, file=out)
+        
+        # One read transaction, so every query sees the same snapshot
+        conn.execute("BEGIN")
+        
+        # All the single-value totals in one round trip
+        cur.execute(SCALAR_STATS_QUERY)
+        (total_arrivals, total_exits, food_revenue, merch_revenue, total_groups,
+         total_staff_actions, total_breakdowns, total_maintenance,
+         cleanliness_samples) = cur.fetchone()
         
         # Visitor stats
-        cur.execute("SELECT COUNT(*) FROM visitor_arrivals")
-        total_arrivals = cur.fetchone()[0]
-        cur.execute("SELECT COUNT(*) FROM visitor_exits")
-        total_exits = cur.fetchone()[0]
+        print(f"\nVisitor Stats:", file=out)
+        print(f"  Total Arrivals: {total_arrivals}", file=out)
+        print(f"  Total Exits: {total_exits}", file=out)
+        print(f"  Still in Park: {total_arrivals - total_exits}", file=out)
         
-        print(f"\nVisitor Stats:")
-        print(f"  Total Arrivals: {total_arrivals}")
-        print(f"  Total Exits: {total_exits}")
-        print(f"  Still in Park: {total_arrivals - total_exits}")
+        # Arrivals by visitor type name
+        cur.execute("SELECT type, COUNT(*) FROM visitor_arrivals GROUP BY type ORDER BY type")
+        for kind, count in cur.fetchall():
+            print(f"    {kind:17} {count:4}", file=out)
         
         # Revenue
-        cur.execute("SELECT SUM(amount) FROM food_purchases")
-        food_revenue = cur.fetchone()[0] or 0
-        cur.execute("SELECT SUM(amount) FROM merch_purchases")
-        merch_revenue = cur.fetchone()[0] or 0
-        
-        print(f"\nRevenue:")
-        print(f"  Food Revenue: ${food_revenue:.2f}")
-        print(f"  Merch Revenue: ${merch_revenue:.2f}")
-        print(f"  Total Revenue: ${food_revenue + merch_revenue:.2f}")
+        print(f"\nRevenue:", file=out)
+        print(f"  Food Revenue: ${food_revenue:.2f}", file=out)
+        print(f"  Merch Revenue: ${merch_revenue:.2f}", file=out)
+        print(f"  Total Revenue: ${food_revenue + merch_revenue:.2f}", file=out)
         
         # Top rides
         cur.execute("""
             SELECT ride_name, COUNT(*) as rides 
             FROM rides 
             GROUP BY ride_name 
-            ORDER BY rides DESC 
+            ORDER BY rides DESC, ride_name
             LIMIT 5
         """)
-        print(f"\nTop 5 Rides:")
+        print(f"\nTop 5 Rides:", file=out)
         for ride, count in cur.fetchall():
-            print(f"  {ride:20} {count:4} rides")
+            print(f"  {ride:20} {count:4} rides", file=out)
         
         # Social groups
-        cur.execute("SELECT COUNT(*) FROM social_groups")
-        total_groups = cur.fetchone()[0]
         if total_groups > 0:
             cur.execute("""
                 SELECT group_type, COUNT(*) as count, AVG(group_size) as avg_size
                 FROM social_groups
                 GROUP BY group_type
             """)
-            print(f"\nSocial Groups: ({total_groups} total)")
+            print(f"\nSocial Groups: ({total_groups} total)", file=out)
             for group_type, count, avg_size in cur.fetchall():
-                print(f"  {group_type:15} {count:3} groups (avg size: {avg_size:.1f})")
+                print(f"  {group_type:15} {count:3} groups (avg size: {avg_size:.1f})", file=out)
         
         # Staff actions
-        cur.execute("SELECT COUNT(*) FROM staff_actions")
-        total_staff_actions = cur.fetchone()[0]
         if total_staff_actions > 0:
             cur.execute("""
                 SELECT action_type, COUNT(*) as count
                 FROM staff_actions
                 GROUP BY action_type
-                ORDER BY count DESC
+                ORDER BY count DESC, action_type
                 LIMIT 10
             """)
-            print(f"\nStaff Actions: ({total_staff_actions} total)")
+            print(f"\nStaff Actions: ({total_staff_actions} total)", file=out)
             for action, count in cur.fetchall():
-                print(f"  {action:25} {count:4} times")
+                print(f"  {action:25} {count:4} times", file=out)
         
         # Ride incidents
-        cur.execute("SELECT COUNT(*) FROM ride_breakdowns")
-        total_breakdowns = cur.fetchone()[0]
-        cur.execute("SELECT COUNT(*) FROM ride_maintenance")
-        total_maintenance = cur.fetchone()[0]
-        
         if total_breakdowns > 0 or total_maintenance > 0:
-            print(f"\nRide Incidents:")
-            print(f"  Breakdowns: {total_breakdowns}")
-            print(f"  Maintenance Events: {total_maintenance}")
+            print(f"\nRide Incidents:", file=out)
+            print(f"  Breakdowns: {total_breakdowns}", file=out)
+            print(f"  Maintenance Events: {total_maintenance}", file=out)
         
         # Cleanliness
-        cur.execute("SELECT COUNT(*) FROM cleanliness_logs")
-        cleanliness_samples = cur.fetchone()[0]
         if cleanliness_samples > 0:
             cur.execute("""
                 SELECT zone, AVG(cleanliness_level) as avg_clean
                 FROM cleanliness_logs
                 GROUP BY zone
-                ORDER BY avg_clean DESC
+                ORDER BY avg_clean DESC, zone
             """)
-            print(f"\nCleanliness (avg over {cleanliness_samples} samples):")
+            print(f"\nCleanliness (avg over {cleanliness_samples} samples):", file=out)
             for zone, avg_clean in cur.fetchall():
-                print(f"  {zone:15} {avg_clean:5.1f}%")
-        
-        conn.close()
+                print(f"  {zone:15} {avg_clean:5.1f}%", file=out)
         
     except sqlite3.Error as e:
-        print(f"Database error: {e}")
+        print(f"Database error: {e}", file=out)
     except Exception as e:
-        print(f"Error: {e}")
+        print(f"Error: {e}", file=out)
+    finally:
+        _flush(out)
+        if conn is not None:
+            if conn.in_transaction:
+                conn.rollback()  # Read only; just end the transaction
+            if own_conn:
+                conn.close()
 
 if __name__ == "__main__":
     db_path = "park_metrics.sqlite"
     
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "summary":
-            view_summary_stats(db_path)
-        elif sys.argv[1] == "tables":
-            view_all_tables(db_path)
-        elif sys.argv[1] == "table":
-            if len(sys.argv) > 2:
-                table_name = sys.argv[2]
-                limit = int(sys.argv[3]) if len(sys.argv) > 3 else 10
-                view_table_sample(db_path, table_name, limit)
+    # One connection shared by everything this run shows
+    try:
+        conn = _open_for_reads(db_path, create_indexes=True)
+    except sqlite3.Error as e:
+        print(f"Database error: {e}")
+        sys.exit(1)
+    
+    try:
+        if len(sys.argv) > 1:
+            if sys.argv[1] == "summary":
+                view_summary_stats(db_path, conn=conn)
+            elif sys.argv[1] == "tables":
+                view_all_tables(db_path, conn=conn)
+            elif sys.argv[1] == "table":
+                if len(sys.argv) > 2:
+                    table_name = sys.argv[2]
+                    limit = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+                    view_table_sample(db_path, table_name, limit, conn=conn)
+                else:
+                    view_table_sample(db_path, conn=conn)
             else:
-                view_table_sample(db_path)
+                print("Usage:")
+                print("  python view_metrics.py summary    - Show summary statistics")
+                print("  python view_metrics.py tables     - List all tables")
+                print("  python view_metrics.py table <name> [limit] - Show table data")
         else:
-            print("Usage:")
-            print("  python view_metrics.py summary    - Show summary statistics")
-            print("  python view_metrics.py tables     - List all tables")
-            print("  python view_metrics.py table <name> [limit] - Show table data")
-    else:
-        # Default: show everything
-        view_all_tables(db_path)
-        view_summary_stats(db_path)
+            # Default: show everything
+            view_all_tables(db_path, conn=conn)
+            view_summary_stats(db_path, conn=conn)
+    finally:
+        conn.close()